@@ -20,7 +20,7 @@ from .const import (
     SERVICE_REFRESH,
     WASTE_TYPE_NAMES,
 )
-from .coordinator import GFADataCoordinator
+from .coordinator import GFADataCoordinator, async_remove_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,18 +31,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GFA Abfallkalender from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Options override the values chosen during setup
+    config = {**entry.data, **entry.options}
+
     # Create coordinator with config data
-    coordinator = GFADataCoordinator(hass, entry.data)
+    coordinator = GFADataCoordinator(hass, config, entry.entry_id)
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the on-disk cache if possible and refresh in the background,
+    # otherwise fetch initial data before setting up the platforms
+    try:
+        if await coordinator.async_load_cache():
+            if coordinator.refresh_due:
+                entry.async_create_background_task(
+                    hass,
+                    coordinator.async_refresh(),
+                    f"{DOMAIN} refresh {entry.entry_id}",
+                )
+        else:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_close()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
-        "config": entry.data,
+        "config": config,
         "unsub_reminder": None,
     }
 
+    # Apply changed options by reloading the entry
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS_LIST)
 
@@ -55,9 +74,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def _setup_reminder(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Set up the daily reminder."""
-    reminder_time_str = entry.data.get(CONF_REMINDER_TIME, "19:00")
+    config = hass.data[DOMAIN][entry.entry_id]["config"]
+    reminder_time_str = config.get(CONF_REMINDER_TIME, "19:00")
     
     # Handle both string and dict formats for time
     if isinstance(reminder_time_str, dict):
@@ -85,7 +110,7 @@ async def _setup_reminder(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def _announce_tomorrow_pickups(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Announce tomorrow's waste pickups via Alexa."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    config = entry.data
+    config = hass.data[DOMAIN][entry.entry_id]["config"]
 
     alexa_entity = config.get(CONF_ALEXA_ENTITY)
     if not alexa_entity:
@@ -108,7 +133,7 @@ async def _announce_tomorrow_pickups(hass: HomeAssistant, entry: ConfigEntry) ->
     # Filter by enabled waste types
     filtered_pickups = []
     for pickup in pickups:
-        waste_type = pickup.get("waste_type")
+        waste_type = pickup.waste_type
         if not enabled_types or waste_type in enabled_types:
             filtered_pickups.append(pickup)
 
@@ -119,9 +144,9 @@ async def _announce_tomorrow_pickups(hass: HomeAssistant, entry: ConfigEntry) ->
     # Build announcement message
     waste_names = []
     for pickup in filtered_pickups:
-        waste_type = pickup.get("waste_type")
+        waste_type = pickup.waste_type
         friendly_name = WASTE_TYPE_NAMES.get(
-            waste_type, pickup.get("summary", waste_type)
+            waste_type, pickup.summary or waste_type
         )
         waste_names.append(friendly_name)
 
@@ -209,3 +234,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached calendar data of a deleted config entry."""
+    await async_remove_cache(hass, entry.entry_id)
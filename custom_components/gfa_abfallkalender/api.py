@@ -1,18 +1,302 @@
 """GFA Lüneburg API Client for fetching waste collection data."""
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+import codecs
+from dataclasses import dataclass, field
+import html
 import logging
+import random
+import re
+import time
 from datetime import datetime
 from html.parser import HTMLParser
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 
+from .ics import IcsFeed, IcsStreamReader
+
 _LOGGER = logging.getLogger(__name__)
 
 SERVLET_URL = "https://portal.gfa-lueneburg.de:8443/WasteManagementLueneburg/WasteManagementServlet"
 
+# Size of the chunks in which ICS downloads are read
+ICS_CHUNK_SIZE = 16384
+
+# How long a calendar fetched in a street batch is kept for its own refresh
+STREET_CALENDAR_MAX_AGE = 86400
+# House numbers downloaded by one street batch, including the requesting one
+STREET_BATCH_SIZE = 8
+
+# Time budgets in seconds for a single portal request and a whole refresh
+DEFAULT_STEP_TIMEOUT = 15
+DEFAULT_REFRESH_TIMEOUT = 120
+# Retries of a single request on timeouts, connection errors and 5xx
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 8.0
+# Consecutive transient failures after which the portal is considered down
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 300
+
+
+_T = TypeVar("_T")
+
+
+class GFAApiError(Exception):
+    """Error raised when the GFA portal returns unusable data."""
+
+
+class GFAPortalUnavailable(GFAApiError):
+    """Error raised without contacting the portal while it is known to be down."""
+
+
+class CircuitBreaker:
+    """Fail fast while the GFA portal keeps failing.
+
+    After a number of consecutive transient failures the breaker opens and
+    rejects requests for a cool-down period. After that it is half open:
+    a single probe request is let through while all others are still
+    rejected. A successful probe closes the breaker, a failed one reopens
+    it. A probe that has not reported back within the cool-down period is
+    presumed lost and the next request becomes the probe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    def _blocked_for(self) -> float:
+        """Return the seconds until the next request may pass."""
+        if self._opened_at is None:
+            return 0.0
+        since = self._opened_at
+        if self._probe_started is not None:
+            since = self._probe_started
+        return max(0.0, since + self._reset_timeout - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being rejected."""
+        return self._blocked_for() > 0
+
+    def check(self) -> None:
+        """Raise GFAPortalUnavailable unless a request may pass.
+
+        While half open, the first caller becomes the probe and passes.
+        """
+        if remaining := self._blocked_for():
+            raise GFAPortalUnavailable(
+                f"GFA portal unavailable, next attempt in {remaining:.0f} s"
+            )
+        if self._opened_at is not None:
+            _LOGGER.debug("Probing whether the GFA portal is reachable again")
+            self._probe_started = time.monotonic()
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self._opened_at is not None:
+            _LOGGER.info("GFA portal reachable again")
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a transient failure and open the breaker at the threshold."""
+        self._failures += 1
+        if self._probe_started is not None:
+            _LOGGER.debug("GFA portal probe failed, pausing requests again")
+        elif self._opened_at is not None or self._failures < self._failure_threshold:
+            # Late failures of requests started before the breaker opened
+            return
+        else:
+            _LOGGER.warning(
+                f"GFA portal failed {self._failures} times in a row, pausing "
+                f"requests for {self._reset_timeout} s"
+            )
+        self._opened_at = time.monotonic()
+        self._probe_started = None
+
+
+PORTAL_BREAKER = CircuitBreaker()
+
+
+TaskFactory = Callable[[Coroutine[Any, Any, _T], str], "asyncio.Task[_T]"]
+
+
+def _create_task(coro: Coroutine[Any, Any, _T], name: str) -> "asyncio.Task[_T]":
+    """Create a plain asyncio task; the default task factory."""
+    return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+@dataclass
+class _Call:
+    """A call in flight and the number of callers awaiting it."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call.
+
+    The first caller for a key starts the work; callers arriving while it
+    is still running await the same result instead of starting their own.
+    Cancelling one caller does not cancel the shared work, but once the
+    last caller has left, the work is cancelled too.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[Hashable, _Call] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Coroutine[Any, Any, _T]],
+        create_task: TaskFactory | None = None,
+    ) -> _T:
+        """Run func for key, or join the call already in flight for key.
+
+        create_task starts the shared task; Home Assistant passes
+        hass.async_create_background_task so the task is tracked and
+        cancelled on shutdown.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            task = (create_task or _create_task)(func(), f"{__name__} {key}")
+            call = self._calls[key] = _Call(task)
+            task.add_done_callback(lambda task: self._forget(key, call))
+        else:
+            _LOGGER.debug(f"Joining in-flight request for {key}")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                _LOGGER.debug(f"Cancelling {key}, no callers left")
+                # Later callers start over instead of joining a cancelled call
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """Drop a finished call and mark its exception as retrieved."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            call.task.exception()
+
+
+_STREET_FETCHES = SingleFlight()
+
+# Errors of a single fetch that are logged and tolerated
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, GFAApiError)
+
+
+@dataclass
+class StreetCalendars:
+    """Calendars of many house numbers with identical schedules deduplicated."""
+
+    schedules: dict[str, IcsFeed] = field(default_factory=dict)
+    house_numbers: dict[str, str] = field(default_factory=dict)
+    fetched: float = field(default_factory=time.monotonic)
+
+    def add(self, house_number: str, feed: IcsFeed) -> None:
+        """Add the calendar of a house number."""
+        self.schedules.setdefault(feed.digest, feed)
+        self.house_numbers[house_number] = feed.digest
+
+    def get(self, house_number: str) -> IcsFeed | None:
+        """Return the calendar of a house number."""
+        digest = self.house_numbers.get(house_number)
+        if digest is None:
+            return None
+        return self.schedules[digest]
+
+    def pop(self, house_number: str) -> IcsFeed | None:
+        """Remove and return the calendar of a house number."""
+        digest = self.house_numbers.pop(house_number, None)
+        if digest is None:
+            return None
+        if digest in self.house_numbers.values():
+            return self.schedules[digest]
+        return self.schedules.pop(digest)
+
+
+# House numbers registered per (city, street), see register_address
+_STREET_ADDRESSES: dict[tuple[str, str], Counter[str]] = {}
+# Calendars of the last street batch not yet taken by their address
+_STREET_CALENDARS: dict[tuple[str, str], StreetCalendars] = {}
+# House numbers of the street batches in flight
+_STREET_BATCHES: dict[tuple[str, str], frozenset[str]] = {}
+
+
+def register_address(
+    city: str, street: str, house_number: str
+) -> Callable[[], None]:
+    """Register an address that is refreshed regularly.
+
+    Refreshes of registered addresses go through street batches: the
+    street is resolved once and the calendars of all its registered house
+    numbers are downloaded together. The calendars of the other house
+    numbers are kept for their own next refresh. Returns a function that
+    unregisters the address.
+    """
+    key = (city, street)
+    house_number = str(house_number)
+    _STREET_ADDRESSES.setdefault(key, Counter())[house_number] += 1
+
+    def unregister() -> None:
+        """Unregister the address and drop its pending calendar."""
+        addresses = _STREET_ADDRESSES[key]
+        addresses[house_number] -= 1
+        if addresses[house_number] > 0:
+            return
+        del addresses[house_number]
+        if calendars := _STREET_CALENDARS.get(key):
+            calendars.pop(house_number)
+        if not addresses:
+            del _STREET_ADDRESSES[key]
+            _STREET_CALENDARS.pop(key, None)
+
+    return unregister
+
+
+def _pending_street_calendars(key: tuple[str, str]) -> StreetCalendars | None:
+    """Return the calendars kept from earlier street batches, if still fresh."""
+    calendars = _STREET_CALENDARS.get(key)
+    if calendars is None:
+        return None
+    if time.monotonic() - calendars.fetched > STREET_CALENDAR_MAX_AGE:
+        del _STREET_CALENDARS[key]
+        return None
+    return calendars
+
+
+def _take_street_calendar(key: tuple[str, str], house_number: str) -> IcsFeed | None:
+    """Take the calendar of an address from the last street batch."""
+    if calendars := _pending_street_calendars(key):
+        return calendars.pop(house_number)
+    return None
+
 
 class HiddenInputParser(HTMLParser):
-    """Parser for extracting hidden input fields from HTML."""
+    """Parser for extracting hidden input fields from HTML.
+
+    Reference implementation of FormScanner, which is used for requests.
+    """
 
     def __init__(self):
         super().__init__()
@@ -78,22 +362,173 @@ class HiddenInputParser(HTMLParser):
             self._current_select = None
 
 
+# Start and end tags relevant to the servlet form. Comments and scripts are
+# matched too, so that tags inside them can be skipped like HTMLParser does.
+_FORM_TAG_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<script\b.*?</script\s*>"
+    r"""|<(/?)(input|select|option)\b((?:[^>"']|"[^"]*"|'[^']*')*)>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(
+    r"""([^\s=/>"']+)(?:\s*=+\s*(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?"""
+)
+_SELECT_LISTS = {"Ort": "cities", "Strasse": "streets", "Hausnummer": "house_numbers"}
+
+
+def _scan_attrs(text: str) -> dict[str, str | None]:
+    """Parse the attributes of a tag like HTMLParser does."""
+    attrs: dict[str, str | None] = {}
+    for match in _ATTR_RE.finditer(text):
+        name, double, single, bare = match.groups()
+        value = next((v for v in (double, single, bare) if v is not None), None)
+        if value is not None and "&" in value:
+            value = html.unescape(value)
+        attrs[name.lower()] = value
+    return attrs
+
+
+class FormScanner:
+    """Fast scanner for the servlet form.
+
+    Extracts the same data as HiddenInputParser - hidden inputs and the
+    Ort/Strasse/Hausnummer option lists - but only looks at the few tags it
+    needs instead of tokenizing the whole page. Like the reference, it
+    scans the whole page, so forms before or after the servlet form are
+    handled the same way.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scanner."""
+        self._args: dict[str, str] = {}
+        self._lists: dict[str, list[str]] = {
+            "cities": [],
+            "streets": [],
+            "house_numbers": [],
+        }
+
+    @property
+    def args(self) -> dict[str, str]:
+        """Return parsed hidden input fields."""
+        return self._args
+
+    @property
+    def cities(self) -> list[str]:
+        """Return list of available cities."""
+        return self._lists["cities"]
+
+    @property
+    def streets(self) -> list[str]:
+        """Return list of available streets."""
+        return self._lists["streets"]
+
+    @property
+    def house_numbers(self) -> list[str]:
+        """Return list of available house numbers."""
+        return self._lists["house_numbers"]
+
+    def feed(self, text: str) -> None:
+        """Scan a servlet page."""
+        current_list: list[str] | None = None
+
+        for match in _FORM_TAG_RE.finditer(text):
+            closing, tag, attr_text = match.groups()
+            if tag is None:
+                # Comment or script
+                continue
+            tag = tag.lower()
+
+            if closing:
+                if tag == "select":
+                    current_list = None
+                continue
+
+            if tag == "input":
+                attrs = _scan_attrs(attr_text)
+                if str(attrs.get("type", "")).lower() == "hidden":
+                    name = attrs.get("name")
+                    if name:
+                        self._args[name] = attrs.get("value", "")
+            elif tag == "select":
+                list_name = _SELECT_LISTS.get(_scan_attrs(attr_text).get("name", ""))
+                if list_name:
+                    current_list = self._lists[list_name]
+            elif tag == "option" and current_list is not None:
+                value = _scan_attrs(attr_text).get("value", "")
+                if value:
+                    # Replace &nbsp; with regular space
+                    current_list.append(
+                        value.replace("\xa0", " ").replace("&nbsp;", " ")
+                    )
+
+
+async def async_read_ics_feed(response: aiohttp.ClientResponse) -> IcsFeed:
+    """Read an ICS response in chunks without holding the whole body."""
+    decoder = codecs.getincrementaldecoder(response.charset or "utf-8-sig")(
+        errors="replace"
+    )
+    reader = IcsStreamReader()
+    async for chunk in response.content.iter_chunked(ICS_CHUNK_SIZE):
+        reader.feed(decoder.decode(chunk))
+    reader.feed(decoder.decode(b"", final=True))
+    return reader.close()
+
+
+async def _read_text(response: aiohttp.ClientResponse) -> str:
+    """Read a response body as text."""
+    return await response.text()
+
+
 class GFALueneburgAPI:
     """API client for GFA Lüneburg waste calendar."""
 
-    def __init__(self) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session_factory: Callable[..., aiohttp.ClientSession] | None = None,
+        create_task: TaskFactory | None = None,
+        step_timeout: float = DEFAULT_STEP_TIMEOUT,
+        refresh_timeout: float = DEFAULT_REFRESH_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        """Initialize the API client.
+
+        session_factory creates the client's sessions and is called with a
+        cookie_jar keyword; Home Assistant passes one bound to its shared
+        connection pool. Every session gets its own cookie jar, so the
+        servlet session of one client never leaks into another.
+
+        create_task starts the shared fetch tasks, see SingleFlight.run.
+
+        step_timeout bounds every single portal request, refresh_timeout the
+        whole multi-year fetch in get_ics_calendar.
+        """
+        self._session_factory = session_factory or aiohttp.ClientSession
+        self._create_task = create_task
+        self._step_timeout = step_timeout
+        self._refresh_timeout = refresh_timeout
+        self._retries = retries
         self._session: aiohttp.ClientSession | None = None
         self._args: dict[str, str] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
+        """Get or create the session of the setup wizard."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = self._session_factory(cookie_jar=aiohttp.CookieJar())
         return self._session
 
+    async def _new_pipeline_session(self) -> aiohttp.ClientSession:
+        """Create a short-lived session with its own cookie jar.
+
+        The servlet session (JSESSIONID) and form state stay private to one
+        pipeline.
+        """
+        return self._session_factory(cookie_jar=aiohttp.CookieJar())
+
     async def close(self) -> None:
-        """Close the session."""
+        """Close the session.
+
+        The underlying connection pool is left open for its other users.
+        """
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -113,16 +548,7 @@ class GFALueneburgAPI:
         """Fetch the list of available cities."""
         session = await self._get_session()
 
-        async with session.get(
-            SERVLET_URL,
-            params={"SubmitAction": "wasteDisposalServices", "InFrameMode": "FALSE"},
-            timeout=30,
-        ) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
+        parser = await self._open_form(session)
         self._args = parser.args
         
         return parser.cities
@@ -145,12 +571,7 @@ class GFALueneburgAPI:
         args["SubmitAction"] = "CITYCHANGED"
         args["Focus"] = "Ort"
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
+        parser = await self._submit(session, args)
         self._args = parser.args
         
         return parser.streets
@@ -173,33 +594,247 @@ class GFALueneburgAPI:
         args["SubmitAction"] = "STREETCHANGED"
         args["Focus"] = "Strasse"
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
+        parser = await self._submit(session, args)
         self._args = parser.args
         
         return parser.house_numbers
 
-    async def _fetch_ics_for_year(
-        self, city: str, street: str, house_number: str, year: int
-    ) -> str:
-        """Fetch the ICS calendar data for a specific year."""
-        session = await self._get_session()
+    async def _fetch_address(
+        self, city: str, street: str, house_number: str, years: tuple[int, ...]
+    ) -> dict[int, IcsFeed | Exception]:
+        """Fetch the ICS calendars of an address for several years.
 
-        # Step 1: Initial page
-        async with session.get(
-            SERVLET_URL,
+        Returns the feed or the tolerated fetch error of every year.
+        Concurrent fetches of the same address and years, from any client,
+        share a single request sequence.
+        """
+        house_number = str(house_number)
+        results = await _STREET_FETCHES.run(
+            (city, street, years, house_number),
+            lambda: self._within_budget(
+                self._run_street_pipeline(city, street, [house_number], years)
+            ),
+            self._create_task,
+        )
+        return results[house_number]
+
+    async def _fetch_street(
+        self, city: str, street: str, house_number: str, years: tuple[int, ...]
+    ) -> StreetCalendars:
+        """Fetch the calendars of an address and its registered neighbours.
+
+        Concurrent fetches of the same street, from any client, share one
+        batch. The calendars of the neighbours are kept for their own
+        refresh.
+        """
+        return await _STREET_FETCHES.run(
+            (city, street, years),
+            lambda: self._run_street_batch(city, street, house_number, years),
+            self._create_task,
+        )
+
+    async def _run_street_batch(
+        self, city: str, street: str, house_number: str, years: tuple[int, ...]
+    ) -> StreetCalendars:
+        """Download an address first, then as many neighbours as fit.
+
+        The batch is limited to STREET_BATCH_SIZE house numbers, skipping
+        neighbours whose calendar from an earlier batch has not been taken
+        yet. When the refresh budget runs out, the batch stops and keeps
+        the calendars downloaded completely so far, which normally include
+        the requesting address.
+        """
+        key = (city, street)
+        pending = _pending_street_calendars(key)
+        neighbours = sorted(
+            number
+            for number in _STREET_ADDRESSES.get(key, ())
+            if number != house_number
+            and (pending is None or pending.get(number) is None)
+        )
+        house_numbers = [house_number, *neighbours[: STREET_BATCH_SIZE - 1]]
+        _LOGGER.debug(
+            f"Fetching {len(house_numbers)} calendars for {city}, {street}"
+        )
+
+        results: dict[str, dict[int, IcsFeed | Exception]] = {}
+        _STREET_BATCHES[key] = frozenset(house_numbers)
+        try:
+            async with asyncio.timeout(self._refresh_timeout):
+                await self._run_street_pipeline(
+                    city, street, house_numbers, years, results
+                )
+        except TimeoutError:
+            _LOGGER.warning(
+                f"Street batch for {city}, {street} exceeded its budget of "
+                f"{self._refresh_timeout} s, keeping the finished calendars"
+            )
+        finally:
+            del _STREET_BATCHES[key]
+
+        calendars = StreetCalendars()
+        for number, year_results in results.items():
+            if len(year_results) < len(years):
+                # Cut off by the budget
+                continue
+            try:
+                calendars.add(number, self._combine_results(year_results))
+            except GFAApiError as err:
+                _LOGGER.warning(f"{city}, {street} {number}: {err}")
+
+        _LOGGER.debug(
+            f"Fetched {len(calendars.house_numbers)} calendars with "
+            f"{len(calendars.schedules)} distinct schedules"
+        )
+        if key in _STREET_ADDRESSES:
+            if pending := _pending_street_calendars(key):
+                # Keep the older fetch time, so nothing is kept too long
+                for number, digest in pending.house_numbers.items():
+                    if calendars.get(number) is None:
+                        calendars.add(number, pending.schedules[digest])
+                calendars.fetched = pending.fetched
+            _STREET_CALENDARS[key] = calendars
+        return calendars
+
+    async def _run_street_pipeline(
+        self,
+        city: str,
+        street: str,
+        house_numbers: list[str],
+        years: tuple[int, ...],
+        results: dict[str, dict[int, IcsFeed | Exception]] | None = None,
+    ) -> dict[str, dict[int, IcsFeed | Exception]]:
+        """Resolve a street once and download the calendars one after another.
+
+        The wizard only has to be walked once; every house number and year
+        is then forwarded and downloaded from the same resolved form. If a
+        download fails, the servlet state is unknown, so the street is
+        resolved again in a fresh session for the remaining downloads.
+
+        The downloads share one servlet session and so cannot overlap. For
+        a single address that is 7 requests in sequence, against 10
+        requests in 5 round trips for one full wizard per year in parallel
+        (see scripts/bench_refresh_pipeline.py).
+
+        Results are filled into results as they arrive, so a caller that
+        cancels the pipeline keeps the downloads finished until then.
+        """
+        if results is None:
+            results = {}
+        session: aiohttp.ClientSession | None = None
+        form_args: dict[str, str] | None = None
+        try:
+            for house_number in house_numbers:
+                year_results = results[house_number] = {}
+                for year in years:
+                    try:
+                        if form_args is None:
+                            if session is not None:
+                                await session.close()
+                            session = await self._new_pipeline_session()
+                            form_args = await self._run_handshake(
+                                session, city, street, house_number, year
+                            )
+                        year_results[year] = await self._download_for_year(
+                            session, form_args, city, street, house_number, year
+                        )
+                    except GFAPortalUnavailable:
+                        raise
+                    except FETCH_ERRORS as err:
+                        year_results[year] = err
+                        form_args = None
+        finally:
+            if session is not None:
+                await session.close()
+        return results
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        *,
+        params: dict[str, str] | None = None,
+        data: dict[str, str] | None = None,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[_T]] = _read_text,
+    ) -> _T:
+        """Send one servlet request and return the response body.
+
+        The body is read with the read callback, as text by default.
+
+        Transient failures (timeouts, connection errors and 5xx responses)
+        are retried with jittered exponential backoff and reported to the
+        shared circuit breaker, which fails fast while the portal is down.
+        """
+        attempt = 0
+        while True:
+            PORTAL_BREAKER.check()
+            try:
+                async with session.request(
+                    method,
+                    SERVLET_URL,
+                    params=params,
+                    data=data,
+                    timeout=aiohttp.ClientTimeout(total=self._step_timeout),
+                ) as response:
+                    response.raise_for_status()
+                    body = await read(response)
+            except aiohttp.ClientResponseError as err:
+                if err.status < 500:
+                    PORTAL_BREAKER.record_success()
+                    raise
+                error: Exception = err
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as err:
+                error = err
+            else:
+                PORTAL_BREAKER.record_success()
+                return body
+
+            PORTAL_BREAKER.record_failure()
+            if attempt >= self._retries or PORTAL_BREAKER.is_open:
+                raise error
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+            attempt += 1
+            _LOGGER.debug(
+                f"Portal request failed ({error!r}), retry {attempt} in {delay:.1f} s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _open_form(self, session: aiohttp.ClientSession) -> FormScanner:
+        """Load the initial servlet page and parse its form."""
+        text = await self._request(
+            session,
+            "GET",
             params={"SubmitAction": "wasteDisposalServices", "InFrameMode": "FALSE"},
-            timeout=30,
-        ) as response:
-            response.raise_for_status()
-            text = await response.text()
+        )
+
+        parser = FormScanner()
+        parser.feed(text)
+        return parser
+
+    async def _submit(
+        self, session: aiohttp.ClientSession, args: dict[str, str]
+    ) -> FormScanner:
+        """Post the servlet form and parse the resulting page."""
+        text = await self._request(session, "POST", data=args)
 
-        parser = HiddenInputParser()
+        parser = FormScanner()
         parser.feed(text)
+        return parser
+
+    async def _run_handshake(
+        self,
+        session: aiohttp.ClientSession,
+        city: str,
+        street: str,
+        house_number: str,
+        year: int,
+    ) -> dict[str, str]:
+        """Walk the wizard up to the point where the address is resolved.
+
+        Returns the form arguments of the resolved address.
+        """
+        # Step 1: Initial page
+        parser = await self._open_form(session)
         args = parser.args
 
         zeitraum = f"Jahresübersicht {year}"
@@ -213,13 +848,7 @@ class GFALueneburgAPI:
         args["SubmitAction"] = "CITYCHANGED"
         args["Focus"] = "Ort"
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
-        args = parser.args
+        args = (await self._submit(session, args)).args
 
         # Step 3: Select street
         args["Zeitraum"] = zeitraum
@@ -230,28 +859,27 @@ class GFALueneburgAPI:
         args["SubmitAction"] = "STREETCHANGED"
         args["Focus"] = "Strasse"
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
-        args = parser.args
-
+        return (await self._submit(session, args)).args
+
+    async def _download_for_year(
+        self,
+        session: aiohttp.ClientSession,
+        form_args: dict[str, str],
+        city: str,
+        street: str,
+        house_number: str,
+        year: int,
+    ) -> IcsFeed:
+        """Forward a resolved address form to the results and download ICS."""
         # Step 4: Forward to results
-        args["Zeitraum"] = zeitraum
+        args = form_args.copy()
+        args["Zeitraum"] = f"Jahresübersicht {year}"
         args["Ort"] = city
         args["Strasse"] = street
         args["Hausnummer"] = str(house_number)
         args["SubmitAction"] = "forward"
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            text = await response.text()
-
-        parser = HiddenInputParser()
-        parser.feed(text)
-        args = parser.args
+        args = (await self._submit(session, args)).args
 
         # Step 5: Download ICS
         args["ApplicationName"] = "com.athos.kd.lueneburg.AbfuhrTerminModel"
@@ -264,11 +892,14 @@ class GFALueneburgAPI:
         for key in ["Zeitraum", "Ort", "Strasse", "Hausnummer"]:
             args.pop(key, None)
 
-        async with session.post(SERVLET_URL, data=args, timeout=30) as response:
-            response.raise_for_status()
-            ics_content = await response.text()
+        feed = await self._request(
+            session, "POST", data=args, read=async_read_ics_feed
+        )
 
-        return ics_content
+        if not feed.is_calendar:
+            raise GFAApiError(f"No calendar data returned for {year}")
+
+        return feed
 
     async def get_ics_calendar(
         self, city: str, street: str, house_number: str
@@ -278,71 +909,98 @@ class GFALueneburgAPI:
         Fetches both current year and next year's calendar data,
         then merges them into a single ICS file.
         """
+        feed = await self.get_calendar_feed(city, street, house_number)
+        return feed.to_ical()
+
+    async def get_calendar_feed(
+        self, city: str, street: str, house_number: str
+    ) -> IcsFeed:
+        """Fetch the merged calendar of the current and next year.
+
+        The downloads are streamed into IcsFeed objects, so the raw ICS text
+        is never held in memory as a whole.
+        """
         current_year = datetime.now().year
         next_year = current_year + 1
         
         _LOGGER.debug(f"Fetching calendar for {city}, {street} {house_number}")
         
-        # Fetch current year
-        try:
-            ics_current = await self._fetch_ics_for_year(
-                city, street, house_number, current_year
-            )
-            _LOGGER.debug(f"Fetched {current_year} calendar: {len(ics_current)} bytes")
-        except Exception as e:
-            _LOGGER.warning(f"Could not fetch {current_year} calendar: {e}")
-            ics_current = ""
-        
-        # Fetch next year
+        years = (current_year, next_year)
+        house_number = str(house_number)
+        key = (city, street)
+
+        # Registered addresses are fetched together with their street, unless
+        # a batch without them is already running
+        batch = _STREET_BATCHES.get(key)
+        if house_number in _STREET_ADDRESSES.get(key, ()) and (
+            batch is None or house_number in batch
+        ):
+            if feed := _take_street_calendar(key, house_number):
+                _LOGGER.debug("Using the calendar fetched with the street")
+                return feed
+            try:
+                calendars = await self._fetch_street(
+                    city, street, house_number, years
+                )
+            except GFAPortalUnavailable:
+                raise
+            except FETCH_ERRORS as err:
+                _LOGGER.debug(f"Street batch failed, fetching the address: {err}")
+            else:
+                if feed := calendars.pop(house_number):
+                    return feed
+
+        # Resolve the address once and fetch both years within the budget
+        results = await self._within_budget(
+            self._fetch_address(city, street, house_number, years)
+        )
+        return self._combine_results(results)
+
+    async def _within_budget(self, aw: Awaitable[_T]) -> _T:
+        """Await aw, cancelling it once the refresh budget is spent.
+
+        Shared fetches apply the budget inside their task as well, so the
+        work stops even while callers keep joining it.
+        """
         try:
-            ics_next = await self._fetch_ics_for_year(
-                city, street, house_number, next_year
-            )
-            _LOGGER.debug(f"Fetched {next_year} calendar: {len(ics_next)} bytes")
-        except Exception as e:
-            _LOGGER.warning(f"Could not fetch {next_year} calendar: {e}")
-            ics_next = ""
-        
+            async with asyncio.timeout(self._refresh_timeout):
+                return await aw
+        except TimeoutError as err:
+            raise GFAApiError(
+                f"Refresh exceeded its budget of {self._refresh_timeout} s"
+            ) from err
+
+    def _combine_results(self, results: dict[int, IcsFeed | Exception]) -> IcsFeed:
+        """Combine the calendars of the current and the next year.
+
+        results maps each year to its feed or the error of its fetch.
+        """
+        feeds_by_year: dict[int, IcsFeed] = {}
+        for year, result in results.items():
+            if isinstance(result, Exception):
+                _LOGGER.warning(f"Could not fetch {year} calendar: {result}")
+                continue
+            _LOGGER.debug(f"Fetched {year} calendar: {len(result.events)} events")
+            feeds_by_year[year] = result
+
+        current_year, next_year = sorted(results)
+        return self._combine_years(
+            feeds_by_year.get(current_year), feeds_by_year.get(next_year)
+        )
+
+    def _combine_years(
+        self, current: IcsFeed | None, upcoming: IcsFeed | None
+    ) -> IcsFeed:
+        """Combine the calendars of the current and the next year."""
         # Merge calendars
-        if ics_current and ics_next:
-            # Extract events from next year's calendar and add to current
-            merged = self._merge_ics_calendars(ics_current, ics_next)
-            _LOGGER.debug(f"Merged calendar: {len(merged)} bytes")
+        if current and upcoming:
+            # Add events from next year's calendar to current
+            merged = current.merge(upcoming)
+            _LOGGER.debug(f"Merged calendar: {len(merged.events)} events")
             return merged
-        elif ics_next:
-            return ics_next
-        elif ics_current:
-            return ics_current
+        elif upcoming:
+            return upcoming
+        elif current:
+            return current
         else:
-            raise Exception("Could not fetch calendar data for any year")
-
-    def _merge_ics_calendars(self, ics1: str, ics2: str) -> str:
-        """Merge two ICS calendar strings into one."""
-        # Extract VEVENT blocks from second calendar
-        events_to_add = []
-        in_event = False
-        current_event = []
-        
-        for line in ics2.split('\n'):
-            if line.strip() == 'BEGIN:VEVENT':
-                in_event = True
-                current_event = [line]
-            elif line.strip() == 'END:VEVENT':
-                current_event.append(line)
-                events_to_add.append('\n'.join(current_event))
-                in_event = False
-                current_event = []
-            elif in_event:
-                current_event.append(line)
-        
-        if not events_to_add:
-            return ics1
-        
-        # Insert events before END:VCALENDAR
-        end_marker = 'END:VCALENDAR'
-        if end_marker in ics1:
-            insert_pos = ics1.rfind(end_marker)
-            merged = ics1[:insert_pos] + '\n'.join(events_to_add) + '\n' + ics1[insert_pos:]
-            return merged
-        
-        return ics1
+            raise GFAApiError("Could not fetch calendar data for any year")
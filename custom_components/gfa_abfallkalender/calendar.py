@@ -6,10 +6,11 @@ from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, WASTE_TYPE_NAMES, WASTE_TYPE_ICONS
-from .coordinator import GFADataCoordinator
+from .coordinator import GFADataCoordinator, PickupChanges
+from .entity import GFACoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ async def async_setup_entry(
     async_add_entities([GFACalendarEntity(coordinator, entry)])
 
 
-class GFACalendarEntity(CoordinatorEntity, CalendarEntity):
+class GFACalendarEntity(GFACoordinatorEntity, CalendarEntity):
     """Calendar entity for GFA waste collection dates."""
 
     _attr_icon = "mdi:trash-can-outline"
@@ -39,18 +40,35 @@ class GFACalendarEntity(CoordinatorEntity, CalendarEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_calendar"
         self._attr_name = "GFA Abfallkalender"
+        self._events: list[CalendarEvent] = []
+        self._events_version: int | None = None
+
+    def _is_affected(self, changes: PickupChanges) -> bool:
+        """Return True if the next event, the schedule or the day changed."""
+        return None in changes.waste_types or changes.schedule or changes.day
+
+    def _calendar_events(self) -> list[CalendarEvent]:
+        """Return the events of all pickups, built once per data version."""
+        if self._events_version != self.coordinator.data_version:
+            self._events = [
+                CalendarEvent(
+                    start=pickup.date,
+                    end=pickup.date + timedelta(days=1),
+                    summary=pickup.summary,
+                    description=pickup.description,
+                )
+                for pickup in self.coordinator.schedule
+            ]
+            self._events_version = self.coordinator.data_version
+        return self._events
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        pickup = self.coordinator.get_next_pickup()
-        if pickup:
-            return CalendarEvent(
-                start=pickup["date"],
-                end=pickup["date"] + timedelta(days=1),
-                summary=pickup["summary"],
-                description=pickup.get("description", ""),
-            )
+        events = self._calendar_events()
+        index = self.coordinator.schedule.position(dt_util.now().date())
+        if index < len(events):
+            return events[index]
         return None
 
     async def async_get_events(
@@ -60,24 +78,12 @@ class GFACalendarEntity(CoordinatorEntity, CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        events = []
-        
         if not self.coordinator.data:
-            return events
+            return []
 
         start = start_date.date() if isinstance(start_date, datetime) else start_date
         end = end_date.date() if isinstance(end_date, datetime) else end_date
 
-        for event_data in self.coordinator.data.get("events", []):
-            event_date = event_data["date"]
-            if start <= event_date <= end:
-                events.append(
-                    CalendarEvent(
-                        start=event_date,
-                        end=event_date + timedelta(days=1),
-                        summary=event_data["summary"],
-                        description=event_data.get("description", ""),
-                    )
-                )
-
-        return events
+        # Events share the positions of their pickups in the sorted schedule
+        positions = self.coordinator.schedule.positions(start, end)
+        return self._calendar_events()[positions.start : positions.stop]
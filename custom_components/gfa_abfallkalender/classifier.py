@@ -0,0 +1,58 @@
+"""Waste type classification for GFA Abfallkalender."""
+from functools import lru_cache
+import logging
+import re
+
+from .const import WASTE_TYPE_MAPPINGS
+
+_LOGGER = logging.getLogger(__name__)
+
+UNKNOWN_WASTE_TYPE = "unknown"
+
+# Summaries repeat for every pickup, so only a handful of distinct ones exist
+CLASSIFY_CACHE_SIZE = 256
+
+_WASTE_TYPES = tuple(WASTE_TYPE_MAPPINGS)
+_KEYWORD_TYPES = {}
+for _index, _keywords in enumerate(WASTE_TYPE_MAPPINGS.values()):
+    for _keyword in _keywords:
+        _KEYWORD_TYPES.setdefault(_keyword, _index)
+
+# One alternation over all keywords, ordered by the priority of their waste
+# type. The lookahead reports a match at every position, so overlapping
+# keywords are all seen; at a single position the alternation picks the
+# keyword of the highest priority type.
+_KEYWORD_RE = re.compile(
+    "(?=({}))".format("|".join(re.escape(keyword) for keyword in _KEYWORD_TYPES))
+)
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify_waste_type(summary: str) -> str:
+    """Return the waste type of an event summary.
+
+    Like checking the mapping in order, this returns the first waste type
+    any of whose keywords occurs in the summary.
+    """
+    indexes = [
+        _KEYWORD_TYPES[match.group(1)]
+        for match in _KEYWORD_RE.finditer(summary.lower())
+    ]
+    if not indexes:
+        _LOGGER.debug(f"Unknown waste type for summary: {summary}")
+        return UNKNOWN_WASTE_TYPE
+    return _WASTE_TYPES[min(indexes)]
+
+
+def detect_waste_types(text: str) -> set[str]:
+    """Return all waste types with a keyword anywhere in a text.
+
+    Used on whole ICS documents, where plain substring checks beat running
+    the alternation at every position.
+    """
+    text = text.lower()
+    return {
+        waste_type
+        for waste_type, keywords in WASTE_TYPE_MAPPINGS.items()
+        if any(keyword in text for keyword in keywords)
+    }
@@ -1,4 +1,5 @@
 """Config flow for GFA Abfallkalender with address lookup."""
+from functools import partial
 import logging
 from typing import Any
 
@@ -8,9 +9,11 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import homeassistant.helpers.entity_registry as er
 
 from .api import GFALueneburgAPI
+from .classifier import detect_waste_types
 from .const import (
     DOMAIN,
     CONF_CITY,
@@ -20,8 +23,23 @@ from .const import (
     CONF_REMINDER_DAYS_BEFORE,
     CONF_ALEXA_ENTITY,
     CONF_ENABLED_WASTE_TYPES,
+    CONF_REFRESH_MIN_HOURS,
+    CONF_REFRESH_MAX_HOURS,
+    CONF_UPCOMING_COUNT,
+    CONF_HORIZON_DAYS,
+    CONF_ATTRIBUTE_MODE,
+    CONF_RECORD_PICKUP_DETAILS,
+    ATTRIBUTE_MODE_FULL,
+    ATTRIBUTE_MODE_COMPACT,
     DEFAULT_REMINDER_TIME,
     DEFAULT_REMINDER_DAYS_BEFORE,
+    DEFAULT_REFRESH_MIN_HOURS,
+    DEFAULT_REFRESH_MAX_HOURS,
+    DEFAULT_UPCOMING_COUNT,
+    DEFAULT_HORIZON_DAYS,
+    MAX_UPCOMING_COUNT,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_RECORD_PICKUP_DETAILS,
     WASTE_TYPE_NAMES,
 )
 
@@ -35,7 +53,7 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._api = GFALueneburgAPI()
+        self._api: GFALueneburgAPI | None = None
         self._city: str | None = None
         self._street: str | None = None
         self._house_number: str | None = None
@@ -46,6 +64,27 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._reminder_config: dict[str, Any] = {}
         self._alexa_config: dict[str, Any] = {}
 
+    async def _async_get_api(self) -> GFALueneburgAPI:
+        """Return the API client, on Home Assistant's connection pool."""
+        if self._api is None:
+            self._api = GFALueneburgAPI(
+                partial(async_create_clientsession, self.hass, auto_cleanup=False),
+                self.hass.async_create_background_task,
+            )
+        return self._api
+
+    async def _async_close_api(self) -> None:
+        """Close the API client."""
+        if self._api is not None:
+            api, self._api = self._api, None
+            await api.close()
+
+    @callback
+    def async_remove(self) -> None:
+        """Release resources when the flow is aborted or abandoned."""
+        if self._api is not None:
+            self.hass.async_create_task(self._async_close_api())
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -58,7 +97,8 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Fetch cities from GFA
         try:
-            self._cities = await self._api.get_cities()
+            api = await self._async_get_api()
+            self._cities = await api.get_cities()
         except Exception as err:
             _LOGGER.error(f"Error fetching cities: {err}")
             errors["base"] = "cannot_connect"
@@ -103,7 +143,8 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Fetch streets for selected city
         try:
-            self._streets = await self._api.get_streets(self._city)
+            api = await self._async_get_api()
+            self._streets = await api.get_streets(self._city)
         except Exception as err:
             _LOGGER.error(f"Error fetching streets: {err}")
             errors["base"] = "cannot_connect"
@@ -145,7 +186,8 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             # Try to fetch ICS to detect waste types
             try:
-                ics_content = await self._api.get_ics_calendar(
+                api = await self._async_get_api()
+                ics_content = await api.get_ics_calendar(
                     self._city, self._street, self._house_number
                 )
                 self._waste_types = self._detect_waste_types(ics_content)
@@ -158,7 +200,8 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Fetch house numbers for selected street
         try:
-            self._house_numbers = await self._api.get_house_numbers(
+            api = await self._async_get_api()
+            self._house_numbers = await api.get_house_numbers(
                 self._city, self._street
             )
         except Exception as err:
@@ -193,16 +236,7 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _detect_waste_types(self, ics_content: str) -> list[str]:
         """Detect waste types from ICS content."""
-        from .const import WASTE_TYPE_MAPPINGS
-        
-        waste_types = set()
-        ics_lower = ics_content.lower()
-        
-        for waste_type, keywords in WASTE_TYPE_MAPPINGS.items():
-            for keyword in keywords:
-                if keyword in ics_lower:
-                    waste_types.add(waste_type)
-                    break
+        waste_types = detect_waste_types(ics_content)
         
         if not waste_types:
             # Return all types if none detected
@@ -285,7 +319,7 @@ class GFAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Close the API session
-            await self._api.close()
+            await self._async_close_api()
             
             # Create the config entry
             return self.async_create_entry(
@@ -351,7 +385,7 @@ class GFAOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current_config = self.config_entry.data
+        current_config = {**self.config_entry.data, **self.config_entry.options}
 
         return self.async_show_form(
             step_id="init",
@@ -386,6 +420,85 @@ class GFAOptionsFlow(config_entries.OptionsFlow):
                             multiple=False,
                         )
                     ),
+                    vol.Required(
+                        CONF_REFRESH_MIN_HOURS,
+                        default=current_config.get(
+                            CONF_REFRESH_MIN_HOURS, DEFAULT_REFRESH_MIN_HOURS
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=24,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="h",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_REFRESH_MAX_HOURS,
+                        default=current_config.get(
+                            CONF_REFRESH_MAX_HOURS, DEFAULT_REFRESH_MAX_HOURS
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=168,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="h",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_UPCOMING_COUNT,
+                        default=current_config.get(
+                            CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=MAX_UPCOMING_COUNT,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HORIZON_DAYS,
+                        default=current_config.get(
+                            CONF_HORIZON_DAYS, DEFAULT_HORIZON_DAYS
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=7,
+                            max=730,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                            unit_of_measurement="Tage",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_ATTRIBUTE_MODE,
+                        default=current_config.get(
+                            CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=ATTRIBUTE_MODE_FULL, label="Vollständig"
+                                ),
+                                selector.SelectOptionDict(
+                                    value=ATTRIBUTE_MODE_COMPACT, label="Kompakt"
+                                ),
+                            ],
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_RECORD_PICKUP_DETAILS,
+                        default=current_config.get(
+                            CONF_RECORD_PICKUP_DETAILS, DEFAULT_RECORD_PICKUP_DETAILS
+                        ),
+                    ): selector.BooleanSelector(),
                 }
             ),
         )
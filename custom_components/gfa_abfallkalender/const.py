@@ -1,5 +1,4 @@
 """Constants for GFA Abfallkalender integration."""
-from datetime import timedelta
 
 DOMAIN = "gfa_abfallkalender"
 
@@ -13,11 +12,41 @@ CONF_REMINDER_DAYS_BEFORE = "reminder_days_before"
 CONF_ALEXA_ENTITY = "alexa_entity"
 CONF_WASTE_TYPES = "waste_types"
 CONF_ENABLED_WASTE_TYPES = "enabled_waste_types"
+CONF_REFRESH_MIN_HOURS = "refresh_min_hours"
+CONF_REFRESH_MAX_HOURS = "refresh_max_hours"
+CONF_UPCOMING_COUNT = "upcoming_count"
+CONF_HORIZON_DAYS = "horizon_days"
+CONF_ATTRIBUTE_MODE = "attribute_mode"
+CONF_RECORD_PICKUP_DETAILS = "record_pickup_details"
 
 # Default values
 DEFAULT_REMINDER_TIME = "19:00"
 DEFAULT_REMINDER_DAYS_BEFORE = 1
-DEFAULT_SCAN_INTERVAL = timedelta(hours=6)
+DEFAULT_REFRESH_MIN_HOURS = 6
+DEFAULT_REFRESH_MAX_HOURS = 48
+DEFAULT_UPCOMING_COUNT = 5
+MAX_UPCOMING_COUNT = 20
+DEFAULT_HORIZON_DAYS = 365
+
+# Attributes of the upcoming pickups sensor: the full set repeats every
+# pickup as flat termin_N_* keys and carries its icon and emoji
+ATTRIBUTE_MODE_FULL = "full"
+ATTRIBUTE_MODE_COMPACT = "compact"
+DEFAULT_ATTRIBUTE_MODE = ATTRIBUTE_MODE_FULL
+DEFAULT_RECORD_PICKUP_DETAILS = True
+
+# Adaptive refresh: the interval doubles with every refresh that finds the
+# calendar unchanged, up to the maximum. Around the turn of the year, when
+# the new calendar is published, and after a change it drops to the minimum.
+REFRESH_YEAR_BOUNDARY_DAYS = 21
+# Stretch each entry's interval by a stable share of up to this fraction so
+# entries and installations do not poll the portal in lockstep
+REFRESH_JITTER = 0.1
+
+# On-disk calendar cache
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 
 # Waste type mappings (German) - Keywords must be lowercase!
 # GFA Lüneburg uses: Biotonne, Gelbe Tonne, Gruenabfall, Papiertonne, Restmuell, Sperrmuell Altmetall
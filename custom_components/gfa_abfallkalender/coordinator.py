@@ -1,27 +1,231 @@
 """Data coordinator for GFA Abfallkalender."""
+import asyncio
+from collections import OrderedDict
+import hashlib
 import logging
+import sys
+import time
 from datetime import datetime, date, timedelta
-from typing import Any
-
-from icalendar import Calendar
-import recurring_ical_events
-
-from homeassistant.core import HomeAssistant
+from functools import partial
+from itertools import islice
+from typing import Any, NamedTuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .api import GFALueneburgAPI
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    GFALueneburgAPI,
+    GFAPortalUnavailable,
+    SingleFlight,
+    async_read_ics_feed,
+    register_address,
+)
 from .const import (
     DOMAIN,
-    DEFAULT_SCAN_INTERVAL,
-    WASTE_TYPE_MAPPINGS,
+    CONF_REFRESH_MIN_HOURS,
+    CONF_REFRESH_MAX_HOURS,
+    CONF_HORIZON_DAYS,
+    DEFAULT_HORIZON_DAYS,
+    DEFAULT_REFRESH_MIN_HOURS,
+    DEFAULT_REFRESH_MAX_HOURS,
+    REFRESH_YEAR_BOUNDARY_DAYS,
+    REFRESH_JITTER,
     CONF_CITY,
     CONF_STREET,
     CONF_HOUSE_NUMBER,
     CONF_ICS_URL,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
 )
+from .classifier import classify_waste_type
+from .ics import IcsFeed, IcsUnsupported, tokenize_events
+from .schedule import NextPickup, Pickup, PickupSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
+_REFRESHES = SingleFlight()
+_PARSES = SingleFlight()
+
+# Parsing runs in the executor; limit how many parses run at the same time
+PARSE_CONCURRENCY = 2
+_PARSE_SEMAPHORE = asyncio.Semaphore(PARSE_CONCURRENCY)
+
+# Pickups are parsed this far beyond the horizon, so an unchanged calendar
+# is not parsed again every day just because the horizon moved on
+PARSE_WINDOW_SLACK = timedelta(days=31)
+
+# Parsed schedules of recently seen calendars, shared by all entries
+PARSED_SCHEDULES_MAX = 32
+_PARSED_SCHEDULES: OrderedDict[tuple[str, date, date], PickupSchedule] = (
+    OrderedDict()
+)
+
+
+class PickupChanges(NamedTuple):
+    """What changed with the last coordinator update."""
+
+    # Waste types whose next pickup changed, None standing for any type
+    waste_types: frozenset[str | None] = frozenset()
+    # A different schedule was loaded
+    schedule: bool = False
+    # The local date moved on
+    day: bool = False
+
+
+NO_CHANGES = PickupChanges()
+
+
+def _near_year_boundary(today: date) -> bool:
+    """Return True around the turn of the year."""
+    new_year = date(today.year + (today.month > 6), 1, 1)
+    return abs((new_year - today).days) <= REFRESH_YEAR_BOUNDARY_DAYS
+
+
+def _refresh_jitter(seed: str) -> float:
+    """Return a stable share in [0, 1) to spread the refreshes of an entry."""
+    return int(hashlib.sha256(seed.encode()).hexdigest()[:8], 16) / 2**32
+
+
+async def async_remove_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the on-disk calendar cache of a config entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}").async_remove()
+
+
+def _parse_calendar(
+    feed: IcsFeed, start_date: date, end_date: date
+) -> PickupSchedule:
+    """Parse, expand and classify the events of a feed.
+
+    Uses the lightweight tokenizer and falls back to icalendar for feeds
+    it does not understand. Runs in the executor, so it must not touch
+    Home Assistant state.
+    """
+    _LOGGER.debug(f"Looking for events between {start_date} and {end_date}")
+
+    try:
+        events = _parse_tokens(feed, start_date, end_date)
+    except IcsUnsupported as err:
+        _LOGGER.debug(f"Parsing with icalendar: {err}")
+        events = _parse_with_icalendar(feed, start_date, end_date)
+
+    # The schedule keeps the pickups sorted by date
+    return PickupSchedule(events)
+
+
+def _parse_tokens(
+    feed: IcsFeed, start_date: date, end_date: date
+) -> list[Pickup]:
+    """Build events from the tokenized feed."""
+    events = []
+    for token in tokenize_events(feed):
+        # Events without a duration still occupy their start day
+        token_end = max(token.end, token.start + timedelta(days=1))
+        if token.start < end_date and token_end > start_date:
+            event_data = _make_event(token.summary, token.start, token.description)
+            if event_data:
+                events.append(event_data)
+    return events
+
+
+def _parse_with_icalendar(
+    feed: IcsFeed, start_date: date, end_date: date
+) -> list[Pickup]:
+    """Build events with icalendar, expanding recurrences if needed."""
+    # Only needed for feeds the tokenizer cannot handle, so the libraries are
+    # imported here, in the executor, instead of during integration setup
+    from icalendar import Calendar
+    import recurring_ical_events
+
+    # Parse calendar
+    calendar = Calendar.from_ical(feed.to_ical())
+
+    if feed.has_recurrence:
+        calendar_events = recurring_ical_events.of(calendar).between(
+            start_date, end_date
+        )
+    else:
+        # Every VEVENT is a single occurrence, no need to expand anything
+        calendar_events = [
+            event
+            for event in calendar.walk("VEVENT")
+            if _occurs_between(event, start_date, end_date)
+        ]
+
+    events = []
+    for event in calendar_events:
+        event_data = _parse_event(event)
+        if event_data:
+            events.append(event_data)
+
+    return events
+
+
+def _occurs_between(event, start_date: date, end_date: date) -> bool:
+    """Return True if a single-occurrence event overlaps [start, end)."""
+    dtstart = event.get("DTSTART")
+    if not dtstart:
+        return False
+    event_start = dtstart.dt
+    if isinstance(event_start, datetime):
+        event_start = event_start.date()
+
+    dtend = event.get("DTEND")
+    event_end = dtend.dt if dtend else event_start
+    if isinstance(event_end, datetime):
+        event_end = event_end.date()
+
+    # Events without a duration still occupy their start day
+    event_end = max(event_end, event_start + timedelta(days=1))
+    return event_start < end_date and event_end > start_date
+
+
+def _parse_event(event) -> Pickup | None:
+    """Parse an ICS event into our format."""
+    try:
+        # Get event date
+        dtstart = event.get("DTSTART")
+        if dtstart:
+            event_date = dtstart.dt
+            if isinstance(event_date, datetime):
+                event_date = event_date.date()
+        else:
+            return None
+
+        return _make_event(
+            str(event.get("SUMMARY", "")),
+            event_date,
+            str(event.get("DESCRIPTION", "")),
+        )
+    except Exception as err:
+        _LOGGER.warning(f"Error parsing event: {err}")
+        return None
+
+
+def _make_event(summary: str, event_date: date, description: str) -> Pickup | None:
+    """Build a pickup, or None for events without a summary."""
+    summary = summary.strip()
+    if not summary:
+        return None
+
+    # Determine waste type
+    waste_type = classify_waste_type(summary)
+
+    # Summaries repeat for every pickup of a type, keep one copy of each
+    return Pickup(
+        event_date,
+        sys.intern(waste_type),
+        sys.intern(summary),
+        sys.intern(description),
+    )
+
 
 class GFADataCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch and manage waste calendar data."""
@@ -30,166 +234,549 @@ class GFADataCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         config: dict[str, Any],
+        entry_id: str | None = None,
     ) -> None:
         """Initialize the coordinator."""
+        self._refresh_min = timedelta(
+            hours=config.get(CONF_REFRESH_MIN_HOURS, DEFAULT_REFRESH_MIN_HOURS)
+        )
+        self._refresh_max = max(
+            timedelta(
+                hours=config.get(CONF_REFRESH_MAX_HOURS, DEFAULT_REFRESH_MAX_HOURS)
+            ),
+            self._refresh_min,
+        )
+        self._jitter = _refresh_jitter(entry_id or repr(sorted(config.items())))
+        self._stable_refreshes = 0
+        self._refresh_reason = "initial"
+        self._refresh_due = True
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            update_interval=self._jittered(self._refresh_min),
         )
         self._config = config
-        self._api = GFALueneburgAPI()
-        self._calendar: Calendar | None = None
-        self._events: list[dict[str, Any]] = []
+        self._horizon = timedelta(
+            days=int(config.get(CONF_HORIZON_DAYS, DEFAULT_HORIZON_DAYS))
+        )
+        self._api = GFALueneburgAPI(
+            partial(async_create_clientsession, hass, auto_cleanup=False),
+            hass.async_create_background_task,
+        )
+        # Parsed up to the parse window, served up to the horizon end
+        self._parsed_schedule = PickupSchedule()
+        self._schedule = self._parsed_schedule
+        self._horizon_end: date | None = None
+        self._next_pickups: dict[str | None, NextPickup] = {}
+        self._next_pickups_date: date | None = None
+        self._changes = NO_CHANGES
+        self._data_version = 0
+        self._unsub_midnight: CALLBACK_TYPE | None = async_track_time_change(
+            hass, self._async_midnight_tick, hour=0, minute=0, second=0
+        )
+        self._parse_key: tuple[str, date, date] | None = None
+        self._last_refresh_cache_hit = False
+        self._stage_timings: dict[str, float] = {}
+        self._store: Store | None = None
+        if entry_id is not None:
+            self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
         
         # Check if we have address-based config or ICS URL
         self._use_api = CONF_CITY in config
 
+        # Addresses on the same street are fetched together
+        self._unregister_address: CALLBACK_TYPE | None = None
+        if self._use_api:
+            self._unregister_address = register_address(
+                config[CONF_CITY], config[CONF_STREET], config[CONF_HOUSE_NUMBER]
+            )
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from ICS calendar."""
         try:
-            if self._use_api:
-                # Fetch ICS using the API with address
-                _LOGGER.debug(
-                    f"Fetching calendar for {self._config[CONF_CITY]}, "
-                    f"{self._config[CONF_STREET]} {self._config[CONF_HOUSE_NUMBER]}"
-                )
-                ics_content = await self._api.get_ics_calendar(
-                    self._config[CONF_CITY],
-                    self._config[CONF_STREET],
-                    self._config[CONF_HOUSE_NUMBER],
+            # Entries for the same source share one fetch
+            started = time.perf_counter()
+            start_date = dt_util.now().date()
+            feed = await _REFRESHES.run(
+                (self._source_key(), start_date),
+                self._async_fetch_feed,
+                self.hass.async_create_background_task,
+            )
+            fetched = time.perf_counter()
+
+            # Unchanged calendar whose parsed window still covers the horizon:
+            # keep the existing event structures, lookups start from today
+            end_date = start_date + self._horizon
+            if self._covers(feed.digest, start_date, end_date) and self.data:
+                _LOGGER.debug("Calendar unchanged, skipping parsing")
+                self._last_refresh_cache_hit = True
+                self._stage_timings = {"fetch": fetched - started}
+                self._adapt_update_interval(changed=False)
+                if self._store is not None:
+                    self._store.async_delay_save(
+                        self._data_to_store, STORAGE_SAVE_DELAY
+                    )
+                if self._advance_horizon(start_date):
+                    # The horizon moved over pickups that were parsed already
+                    return self._build_data(self._schedule, datetime.now())
+                self._changes = NO_CHANGES
+                return {**self.data, "last_update": datetime.now()}
+
+            # Parse a little beyond the horizon so the parse can be reused
+            # on the following days; queries still end at the horizon
+            window_end = end_date + PARSE_WINDOW_SLACK
+            self._set_schedule(
+                await self._async_parse_feed(feed, start_date, window_end),
+                start_date,
+            )
+            changed = self.calendar_digest != feed.digest
+            self._parse_key = (feed.digest, start_date, window_end)
+            self._last_refresh_cache_hit = False
+            parsed = time.perf_counter()
+
+            data = self._build_data(self._schedule, datetime.now())
+            built = time.perf_counter()
+
+            # Parsing runs in the executor, only building holds the loop
+            self._stage_timings = {
+                "fetch": fetched - started,
+                "parse_executor": parsed - fetched,
+                "build_event_loop": built - parsed,
+            }
+            _LOGGER.debug(
+                "Refresh stages: "
+                + ", ".join(
+                    f"{stage} {seconds * 1000:.1f} ms"
+                    for stage, seconds in self._stage_timings.items()
                 )
-            else:
-                # Fetch ICS from URL
-                import aiohttp
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        self._config[CONF_ICS_URL], timeout=30
-                    ) as response:
-                        if response.status != 200:
-                            raise UpdateFailed(
-                                f"Error fetching calendar: HTTP {response.status}"
-                            )
-                        ics_content = await response.text()
-
-            _LOGGER.debug(f"Received ICS content: {len(ics_content)} bytes")
-            
-            # Check if we got valid ICS content
-            if "BEGIN:VCALENDAR" not in ics_content:
-                _LOGGER.error("Invalid ICS content received (no VCALENDAR)")
-                raise UpdateFailed("Invalid calendar data received")
-
-            # Parse calendar
-            self._calendar = Calendar.from_ical(ics_content)
-
-            # Get events for the next 365 days (full year ahead)
-            start_date = datetime.now().date()
-            end_date = start_date + timedelta(days=365)
-
-            _LOGGER.debug(f"Looking for events between {start_date} and {end_date}")
-
-            events = recurring_ical_events.of(self._calendar).between(
-                start_date, end_date
             )
 
-            self._events = []
-            for event in events:
-                event_data = self._parse_event(event)
-                if event_data:
-                    self._events.append(event_data)
-
-            _LOGGER.info(f"Found {len(self._events)} upcoming waste collection events")
-
-            # Sort events by date
-            self._events.sort(key=lambda x: x["date"])
+            _LOGGER.debug(f"Waste types found: {self._schedule.waste_types}")
 
-            # Log first few events for debugging
-            if self._events:
-                _LOGGER.debug(f"Next events: {self._events[:5]}")
+            self._adapt_update_interval(changed)
 
-            # Group events by waste type
-            waste_data = {}
-            for event in self._events:
-                waste_type = event.get("waste_type", "unknown")
-                if waste_type not in waste_data:
-                    waste_data[waste_type] = []
-                waste_data[waste_type].append(event)
+            if self._store is not None:
+                self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
 
-            _LOGGER.debug(f"Waste types found: {list(waste_data.keys())}")
+            return data
 
-            return {
-                "events": self._events,
-                "by_type": waste_data,
-                "last_update": datetime.now(),
-            }
+        except GFAPortalUnavailable as err:
+            if self.data:
+                # Keep serving the last schedule instead of piling up requests
+                _LOGGER.warning(f"{err}, keeping cached calendar data")
+                self._changes = NO_CHANGES
+                self._adapt_update_interval(changed=None)
+                return self.data
+            self._changes = NO_CHANGES
+            self._adapt_update_interval(changed=None)
+            raise UpdateFailed(f"Error fetching calendar: {err}") from err
 
         except Exception as err:
             _LOGGER.error(f"Error updating calendar data: {err}", exc_info=True)
+            self._changes = NO_CHANGES
+            self._adapt_update_interval(changed=None)
             raise UpdateFailed(f"Error fetching calendar: {err}") from err
 
-    def _parse_event(self, event) -> dict[str, Any] | None:
-        """Parse an ICS event into our format."""
-        try:
-            summary = str(event.get("SUMMARY", "")).strip()
-            if not summary:
-                return None
-
-            # Get event date
-            dtstart = event.get("DTSTART")
-            if dtstart:
-                event_date = dtstart.dt
-                if isinstance(event_date, datetime):
-                    event_date = event_date.date()
-            else:
-                return None
-
-            # Determine waste type
-            waste_type = self._detect_waste_type(summary)
-
-            return {
-                "summary": summary,
-                "date": event_date,
-                "waste_type": waste_type,
-                "description": str(event.get("DESCRIPTION", "")),
-            }
-        except Exception as err:
-            _LOGGER.warning(f"Error parsing event: {err}")
-            return None
+    def _backoff_interval(self) -> timedelta:
+        """Return the refresh interval after the current unchanged streak."""
+        if not self._stable_refreshes or _near_year_boundary(dt_util.now().date()):
+            return self._refresh_min
+        # Cap the exponent, the maximum is reached long before that
+        return min(
+            self._refresh_min * 2 ** min(self._stable_refreshes, 16),
+            self._refresh_max,
+        )
 
-    def _detect_waste_type(self, summary: str) -> str:
-        """Detect the waste type from the event summary."""
-        summary_lower = summary.lower()
+    def _jittered(self, interval: timedelta) -> timedelta:
+        """Stretch an interval by this entry's share of the jitter."""
+        return interval * (1 + REFRESH_JITTER * self._jitter)
+
+    @callback
+    def _adapt_update_interval(self, changed: bool | None) -> None:
+        """Pick the interval until the next refresh.
+
+        changed is None if the refresh failed. Unchanged calendars back off
+        exponentially; changes, failures and the turn of the year go back to
+        the minimum interval.
+        """
+        if changed is False:
+            self._stable_refreshes += 1
+        else:
+            self._stable_refreshes = 0
+
+        if changed is None:
+            self._refresh_reason = "failed"
+        elif changed:
+            self._refresh_reason = "changed"
+        elif _near_year_boundary(dt_util.now().date()):
+            self._refresh_reason = "year boundary"
+        else:
+            self._refresh_reason = f"unchanged {self._stable_refreshes}x"
+
+        self.update_interval = self._jittered(self._backoff_interval())
+        _LOGGER.debug(
+            f"Next refresh in {self.update_interval} ({self._refresh_reason})"
+        )
 
-        for waste_type, keywords in WASTE_TYPE_MAPPINGS.items():
-            for keyword in keywords:
-                if keyword in summary_lower:
-                    return waste_type
+    @property
+    def refresh_due(self) -> bool:
+        """Return True if the data should be refreshed right away."""
+        return self._refresh_due
+
+    @property
+    def refresh_policy(self) -> dict[str, Any]:
+        """Return the state of the adaptive refresh schedule."""
+        return {
+            "update_interval": self.update_interval.total_seconds()
+            if self.update_interval
+            else None,
+            "reason": self._refresh_reason,
+            "stable_refreshes": self._stable_refreshes,
+            "min_interval": self._refresh_min.total_seconds(),
+            "max_interval": self._refresh_max.total_seconds(),
+            "jitter": round(self._jitter * REFRESH_JITTER, 4),
+        }
+
+    def _source_key(self) -> tuple[str, ...]:
+        """Return a key identifying the calendar source of this coordinator."""
+        if self._use_api:
+            return (
+                self._config[CONF_CITY],
+                self._config[CONF_STREET],
+                str(self._config[CONF_HOUSE_NUMBER]),
+            )
+        return (self._config[CONF_ICS_URL],)
+
+    @property
+    def last_refresh_cache_hit(self) -> bool:
+        """Return True if the last refresh found the calendar unchanged."""
+        return self._last_refresh_cache_hit
+
+    @property
+    def calendar_digest(self) -> str | None:
+        """Return the digest of the calendar the events were parsed from."""
+        return self._parse_key[0] if self._parse_key else None
+
+    @property
+    def stage_timings(self) -> dict[str, float]:
+        """Return how long each stage of the last refresh took, in seconds."""
+        return self._stage_timings
+
+    async def _async_fetch_feed(self) -> IcsFeed:
+        """Fetch the calendar feed of this coordinator's source."""
+        if self._use_api:
+            # Fetch ICS using the API with address
+            _LOGGER.debug(
+                f"Fetching calendar for {self._config[CONF_CITY]}, "
+                f"{self._config[CONF_STREET]} {self._config[CONF_HOUSE_NUMBER]}"
+            )
+            feed = await self._api.get_calendar_feed(
+                self._config[CONF_CITY],
+                self._config[CONF_STREET],
+                self._config[CONF_HOUSE_NUMBER],
+            )
+        else:
+            # Fetch ICS from URL with Home Assistant's shared session
+            session = async_get_clientsession(self.hass)
+            async with session.get(
+                self._config[CONF_ICS_URL], timeout=30
+            ) as response:
+                if response.status != 200:
+                    raise UpdateFailed(
+                        f"Error fetching calendar: HTTP {response.status}"
+                    )
+                feed = await async_read_ics_feed(response)
+
+        _LOGGER.debug(f"Received ICS content: {len(feed.events)} events")
+        
+        # Check if we got valid ICS content
+        if not feed.is_calendar:
+            _LOGGER.error("Invalid ICS content received (no VCALENDAR)")
+            raise UpdateFailed("Invalid calendar data received")
+
+        return feed
+
+    def _covers(self, digest: str, start_date: date, end_date: date) -> bool:
+        """Return True if the parsed schedule can serve a window.
+
+        That is the case while the calendar is unchanged and the parsed
+        window still reaches the end of the horizon without reaching too
+        far beyond it.
+        """
+        if self._parse_key is None:
+            return False
+        parsed_digest, parsed_start, parsed_end = self._parse_key
+        return (
+            parsed_digest == digest
+            and parsed_start <= start_date
+            and end_date <= parsed_end <= end_date + PARSE_WINDOW_SLACK
+        )
 
-        _LOGGER.debug(f"Unknown waste type for summary: {summary}")
-        return "unknown"
+    async def _async_parse_feed(
+        self, feed: IcsFeed, start_date: date, end_date: date
+    ) -> PickupSchedule:
+        """Parse a calendar feed into a schedule of upcoming pickups."""
+        # Identical schedules (e.g. neighbouring house numbers) are parsed once
+        parse_key = (feed.digest, start_date, end_date)
+        if (schedule := _PARSED_SCHEDULES.get(parse_key)) is not None:
+            _PARSED_SCHEDULES.move_to_end(parse_key)
+            _LOGGER.debug("Reusing parsed events of an identical schedule")
+            return schedule
+
+        return await _PARSES.run(
+            parse_key,
+            lambda: self._async_parse_in_executor(feed, start_date, end_date),
+            self.hass.async_create_background_task,
+        )
 
-    def get_next_pickup(self, waste_type: str | None = None) -> dict[str, Any] | None:
-        """Get the next pickup date."""
-        today = datetime.now().date()
+    async def _async_parse_in_executor(
+        self, feed: IcsFeed, start_date: date, end_date: date
+    ) -> PickupSchedule:
+        """Parse a feed in the executor, limiting concurrent parses."""
+        async with _PARSE_SEMAPHORE:
+            schedule = await self.hass.async_add_executor_job(
+                _parse_calendar, feed, start_date, end_date
+            )
 
-        for event in self._events:
-            if event["date"] >= today:
-                if waste_type is None or event["waste_type"] == waste_type:
-                    return event
+        _LOGGER.info(f"Found {len(schedule)} upcoming waste collection events")
+
+        # Log first few events for debugging
+        if schedule:
+            _LOGGER.debug(f"Next events: {list(islice(schedule, 5))}")
+
+        _PARSED_SCHEDULES[(feed.digest, start_date, end_date)] = schedule
+        while len(_PARSED_SCHEDULES) > PARSED_SCHEDULES_MAX:
+            _PARSED_SCHEDULES.popitem(last=False)
+
+        return schedule
+
+    def _build_data(
+        self, schedule: PickupSchedule, last_update: datetime
+    ) -> dict[str, Any]:
+        """Build the coordinator data from a pickup schedule."""
+        self._data_version += 1
+        previous_date = self._next_pickups_date
+        today = dt_util.now().date()
+        self._changes = PickupChanges(
+            self._update_next_pickups(today),
+            schedule=not self.data or self.data["schedule"] is not schedule,
+            day=today != previous_date,
+        )
+        _LOGGER.debug(f"Changed next pickups: {set(self._changes.waste_types)}")
+        return {
+            "schedule": schedule,
+            "last_update": last_update,
+        }
+
+    async def async_load_cache(self) -> bool:
+        """Populate the coordinator from the on-disk cache.
+
+        Returns True if cached data was found, so the caller can run the
+        network refresh in the background instead of blocking setup on it.
+        Fresh cached data postpones the refresh until it is due, so entries
+        do not all hit the portal right after a restart.
+        """
+        if self._store is None:
+            return False
 
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning(f"Could not load cached calendar data: {err}")
+            return False
+
+        if not stored or not stored.get("events"):
+            return False
+
+        try:
+            schedule = PickupSchedule(
+                Pickup(
+                    date.fromisoformat(event["date"]),
+                    sys.intern(event["waste_type"]),
+                    sys.intern(event["summary"]),
+                    sys.intern(event.get("description", "")),
+                )
+                for event in stored["events"]
+            )
+            last_update = datetime.fromisoformat(stored["last_update"])
+            stable_refreshes = int(stored.get("stable_refreshes", 0))
+            if (
+                stored.get("digest")
+                and stored.get("window_start")
+                and stored.get("window_end")
+            ):
+                self._parse_key = (
+                    stored["digest"],
+                    date.fromisoformat(stored["window_start"]),
+                    date.fromisoformat(stored["window_end"]),
+                )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning(f"Ignoring invalid cached calendar data: {err}")
+            return False
+
+        self._set_schedule(schedule, dt_util.now().date())
+        _LOGGER.debug(f"Loaded {len(schedule)} cached events from {last_update}")
+
+        self._stable_refreshes = stable_refreshes
+        interval = self._jittered(self._backoff_interval())
+        age = datetime.now() - last_update
+        self._refresh_due = age >= interval
+        if not self._refresh_due:
+            self.update_interval = interval - age
+            self._refresh_reason = "cached"
+            _LOGGER.debug(
+                f"Cached data is fresh, next refresh in {self.update_interval}"
+            )
+        self.async_set_updated_data(self._build_data(self._schedule, last_update))
+        return True
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the data to persist in the on-disk cache."""
+        return {
+            "events": [
+                {
+                    "summary": pickup.summary,
+                    "date": pickup.date.isoformat(),
+                    "waste_type": pickup.waste_type,
+                    "description": pickup.description,
+                }
+                for pickup in self._parsed_schedule
+            ],
+            "last_update": self.data["last_update"].isoformat()
+            if self.data
+            else datetime.now().isoformat(),
+            "stable_refreshes": self._stable_refreshes,
+            "digest": self._parse_key[0] if self._parse_key else None,
+            "window_start": self._parse_key[1].isoformat()
+            if self._parse_key
+            else None,
+            "window_end": self._parse_key[2].isoformat()
+            if self._parse_key
+            else None,
+        }
+
+    @callback
+    def _set_schedule(self, parsed: PickupSchedule, today: date) -> None:
+        """Store a parsed schedule and serve it up to the horizon end."""
+        self._parsed_schedule = parsed
+        self._horizon_end = today + self._horizon
+        self._schedule = parsed.until(self._horizon_end)
+
+    @callback
+    def _advance_horizon(self, today: date) -> bool:
+        """Move the horizon end to today's, without parsing again.
+
+        Returns True if pickups of the parsed schedule entered the horizon.
+        """
+        horizon_end = today + self._horizon
+        if horizon_end == self._horizon_end:
+            return False
+        self._horizon_end = horizon_end
+        schedule = self._parsed_schedule.until(horizon_end)
+        # The served schedule is a prefix of the parsed one
+        if len(schedule) == len(self._schedule):
+            return False
+        self._schedule = schedule
+        return True
+
+    @property
+    def schedule(self) -> PickupSchedule:
+        """Return the schedule of pickups up to the end of the horizon."""
+        return self._schedule
+
+    @property
+    def horizon_end(self) -> date | None:
+        """Return the last day sensors and calendar show pickups for."""
+        return self._horizon_end
+
+    @callback
+    def _update_next_pickups(self, today: date) -> frozenset[str | None]:
+        """Compute the next pickup of every waste type relative to today.
+
+        Returns the waste types whose next pickup changed.
+        """
+        previous = self._next_pickups
+        next_pickups = {}
+        for waste_type in (None, *self._schedule.waste_types):
+            if (pickup := self._schedule.next(today, waste_type)) is not None:
+                next_pickups[waste_type] = NextPickup(
+                    pickup, (pickup.date - today).days
+                )
+        self._next_pickups = next_pickups
+        self._next_pickups_date = today
+        return frozenset(
+            waste_type
+            for waste_type in previous.keys() | next_pickups.keys()
+            if previous.get(waste_type) != next_pickups.get(waste_type)
+        )
+
+    @callback
+    def _async_midnight_tick(self, now: datetime) -> None:
+        """Advance day-dependent state at local midnight without fetching."""
+        today = dt_util.now().date()
+        if self.data and self._advance_horizon(today):
+            self.data = self._build_data(self._schedule, self.data["last_update"])
+        else:
+            self._changes = PickupChanges(self._update_next_pickups(today), day=True)
+        if self.data:
+            _LOGGER.debug("Day changed, updating pickup countdowns")
+            self.async_update_listeners()
+
+    @property
+    def data_version(self) -> int:
+        """Return a number that changes whenever new data is built."""
+        return self._data_version
+
+    @property
+    def changes(self) -> PickupChanges:
+        """Return what changed with the last update of the listeners."""
+        return self._changes
+
+    def get_next_pickup_state(
+        self, waste_type: str | None = None
+    ) -> NextPickup | None:
+        """Get the next pickup and how far away it is.
+
+        Served from a table computed once per refresh and day, so entities
+        reading it on every state write do not query the schedule again.
+        """
+        today = dt_util.now().date()
+        if today != self._next_pickups_date:
+            self._update_next_pickups(today)
+        return self._next_pickups.get(waste_type)
+
+    def get_next_pickup(self, waste_type: str | None = None) -> Pickup | None:
+        """Get the next pickup date."""
+        if (state := self.get_next_pickup_state(waste_type)) is not None:
+            return state.pickup
         return None
 
-    def get_pickups_for_date(self, target_date: date) -> list[dict[str, Any]]:
+    def get_pickups_for_date(self, target_date: date) -> list[Pickup]:
         """Get all pickups for a specific date."""
-        return [event for event in self._events if event["date"] == target_date]
+        return self._schedule.on(target_date)
+
+    def get_pickups_between(self, start_date: date, end_date: date) -> list[Pickup]:
+        """Get all pickups from start_date up to and including end_date."""
+        return self._schedule.between(start_date, end_date)
+
+    def get_upcoming_pickups(self, count: int) -> list[Pickup]:
+        """Get the next pickups of any type, starting today."""
+        return self._schedule.upcoming(dt_util.now().date(), count)
 
     def get_all_waste_types(self) -> list[str]:
-        """Get all waste types found in the calendar."""
+        """Get all waste types with pickups up to the horizon end."""
         if not self.data:
             return []
-        return list(self.data.get("by_type", {}).keys())
+        return self._schedule.waste_types
 
     async def async_close(self) -> None:
         """Close API session."""
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        if self._unregister_address is not None:
+            self._unregister_address()
+            self._unregister_address = None
         await self._api.close()
@@ -0,0 +1,37 @@
+"""Diagnostics support for GFA Abfallkalender."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_STREET, CONF_HOUSE_NUMBER, CONF_ICS_URL
+from .coordinator import GFADataCoordinator
+
+TO_REDACT = {CONF_STREET, CONF_HOUSE_NUMBER, CONF_ICS_URL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GFADataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    data = coordinator.data or {}
+
+    return {
+        "config": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": async_redact_data(dict(entry.options), TO_REDACT),
+        "refresh": {
+            "last_update_success": coordinator.last_update_success,
+            "last_update": str(data.get("last_update")),
+            "last_refresh_cache_hit": coordinator.last_refresh_cache_hit,
+            "calendar_digest": coordinator.calendar_digest,
+            "stage_timings": coordinator.stage_timings,
+            "policy": coordinator.refresh_policy,
+        },
+        "events": {
+            "count": len(coordinator.schedule),
+            "horizon_end": str(coordinator.horizon_end),
+            "waste_types": coordinator.get_all_waste_types(),
+        },
+    }
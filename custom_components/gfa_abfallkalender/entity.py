@@ -0,0 +1,26 @@
+"""Base entity for GFA Abfallkalender."""
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import GFADataCoordinator, PickupChanges
+
+
+class GFACoordinatorEntity(CoordinatorEntity[GFADataCoordinator]):
+    """Coordinator entity that only writes its state when it changed."""
+
+    _last_available: bool | None = None
+
+    def _is_affected(self, changes: PickupChanges) -> bool:
+        """Return True if the changes affect this entity's state."""
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the update changed it or the availability."""
+        available = self.available
+        if available == self._last_available and not self._is_affected(
+            self.coordinator.changes
+        ):
+            return
+        self._last_available = available
+        super()._handle_coordinator_update()
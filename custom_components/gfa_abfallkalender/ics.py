@@ -0,0 +1,224 @@
+"""Incremental ICS reader and tokenizer for GFA Abfallkalender."""
+from dataclasses import dataclass, field
+from datetime import date
+import hashlib
+import re
+from typing import NamedTuple
+
+# Properties that differ between otherwise identical schedules
+_VOLATILE_PROPERTIES = ("DTSTAMP", "UID", "CREATED", "LAST-MODIFIED")
+# Properties that make an event expand to more than one occurrence
+RECURRENCE_PROPERTIES = ("RRULE", "RDATE", "EXDATE", "RECURRENCE-ID")
+
+
+@dataclass
+class IcsFeed:
+    """An ICS calendar split into unfolded header lines and VEVENT blocks."""
+
+    header: list[str] = field(default_factory=list)
+    events: list[list[str]] = field(default_factory=list)
+    digest: str = ""
+    has_recurrence: bool = False
+
+    @property
+    def is_calendar(self) -> bool:
+        """Return True if the data contained a VCALENDAR."""
+        return "BEGIN:VCALENDAR" in self.header
+
+    def merge(self, other: "IcsFeed") -> "IcsFeed":
+        """Return a feed with the events of both feeds and this header."""
+        digest = hashlib.sha256(f"{self.digest}{other.digest}".encode()).hexdigest()
+        return IcsFeed(
+            self.header,
+            self.events + other.events,
+            digest,
+            self.has_recurrence or other.has_recurrence,
+        )
+
+    def to_ical(self) -> str:
+        """Return the feed as ICS text."""
+        lines = list(self.header)
+        for event in self.events:
+            lines.extend(event)
+        lines.append("END:VCALENDAR")
+        return "\r\n".join(lines) + "\r\n"
+
+
+class IcsStreamReader:
+    """Build an IcsFeed from ICS text that arrives in chunks.
+
+    Content lines are unfolded as they arrive, so only the current line and
+    the VEVENT blocks seen so far are held in memory - never the raw text.
+    The feed digest identifies the schedule and ignores volatile properties
+    like DTSTAMP and UID. A leading byte order mark is dropped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reader."""
+        self._feed = IcsFeed()
+        self._digest = hashlib.sha256()
+        self._partial = ""
+        self._line: str | None = None
+        self._event: list[str] | None = None
+        self._started = False
+
+    def feed(self, chunk: str) -> None:
+        """Process the next chunk of ICS text."""
+        if not chunk:
+            return
+        if not self._started:
+            self._started = True
+            chunk = chunk.removeprefix("\ufeff")
+        lines = (self._partial + chunk).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._physical_line(line)
+
+    def close(self) -> IcsFeed:
+        """Finish reading and return the feed."""
+        if self._partial:
+            self._physical_line(self._partial)
+            self._partial = ""
+        if self._line is not None:
+            self._content_line(self._line)
+            self._line = None
+        self._feed.digest = self._digest.hexdigest()
+        return self._feed
+
+    def _physical_line(self, line: str) -> None:
+        """Unfold a physical line into the current content line."""
+        line = line.rstrip("\r")
+        if line[:1] in (" ", "\t") and self._line is not None:
+            self._line += line[1:]
+            return
+        if self._line is not None:
+            self._content_line(self._line)
+        self._line = line
+
+    def _content_line(self, line: str) -> None:
+        """Sort a complete content line into the header or a VEVENT block."""
+        if not line:
+            return
+        if not line.startswith(_VOLATILE_PROPERTIES):
+            self._digest.update(line.encode())
+            self._digest.update(b"\n")
+
+        if self._event is not None:
+            self._event.append(line)
+            if line.startswith(RECURRENCE_PROPERTIES):
+                self._feed.has_recurrence = True
+            elif line == "END:VEVENT":
+                self._feed.events.append(self._event)
+                self._event = None
+        elif line == "BEGIN:VEVENT":
+            self._event = [line]
+        elif line != "END:VCALENDAR":
+            self._feed.header.append(line)
+
+
+class IcsUnsupported(ValueError):
+    """Raised for content the lightweight tokenizer does not understand."""
+
+
+class IcsEvent(NamedTuple):
+    """The fields of a single-occurrence VEVENT that the integration uses."""
+
+    uid: str
+    start: date
+    end: date
+    summary: str
+    description: str
+
+
+_DATE_VALUE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})(?:T\d{6}Z?)?")
+_TEXT_ESCAPE_RE = re.compile(r"\\(.)")
+_TEXT_ESCAPES = {"n": "\n", "N": "\n"}
+_EVENT_PROPERTIES = ("UID", "DTSTART", "DTEND", "SUMMARY", "DESCRIPTION")
+
+
+def _split_property(line: str) -> tuple[str, str, str]:
+    """Split a content line into name, parameters and value."""
+    in_quotes = False
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            name, _, params = line[:index].partition(";")
+            return name.upper(), params, line[index + 1 :]
+    raise IcsUnsupported(f"Invalid content line: {line[:40]}")
+
+
+def _date_value(params: str, value: str) -> date:
+    """Return the calendar date of a DATE or DATE-TIME value.
+
+    The date part is taken as written, which is what icalendar yields for
+    floating, UTC and TZID-qualified values alike.
+    """
+    for param in params.split(";"):
+        name, _, param_value = param.partition("=")
+        if name.upper() == "VALUE" and param_value.upper() not in ("DATE", "DATE-TIME"):
+            raise IcsUnsupported(f"Unsupported value type {param_value}")
+    match = _DATE_VALUE_RE.fullmatch(value.strip())
+    if match is None:
+        raise IcsUnsupported(f"Unsupported date value {value}")
+    year, month, day = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError as err:
+        raise IcsUnsupported(f"Invalid date value {value}") from err
+
+
+def _text_value(value: str) -> str:
+    """Unescape a TEXT value."""
+    if "\\" not in value:
+        return value
+    return _TEXT_ESCAPE_RE.sub(
+        lambda match: _TEXT_ESCAPES.get(match.group(1), match.group(1)), value
+    )
+
+
+def tokenize_events(feed: IcsFeed) -> list[IcsEvent]:
+    """Extract the events of a feed without building an icalendar tree.
+
+    Only handles feeds of explicitly dated, non-recurring events, which is
+    what the GFA portal serves. Raises IcsUnsupported for anything else so
+    the caller can fall back to icalendar.
+    """
+    if feed.has_recurrence:
+        raise IcsUnsupported("Feed contains recurring events")
+
+    events = []
+    for block in feed.events:
+        fields: dict[str, tuple[str, str]] = {}
+        depth = 0
+        # The first and last line are BEGIN:VEVENT and END:VEVENT
+        for line in block[1:-1]:
+            if line.startswith("BEGIN:"):
+                depth += 1
+            elif line.startswith("END:"):
+                depth -= 1
+            elif depth == 0 and line.startswith(_EVENT_PROPERTIES):
+                name, params, value = _split_property(line)
+                if name in _EVENT_PROPERTIES:
+                    if name in fields:
+                        raise IcsUnsupported(f"Duplicate {name} property")
+                    fields[name] = (params, value)
+            elif depth == 0 and line.startswith("DURATION"):
+                raise IcsUnsupported("DURATION is not supported")
+
+        if "DTSTART" not in fields:
+            raise IcsUnsupported("Event without DTSTART")
+        start = _date_value(*fields["DTSTART"])
+        end = _date_value(*fields["DTEND"]) if "DTEND" in fields else start
+
+        events.append(
+            IcsEvent(
+                uid=fields.get("UID", ("", ""))[1],
+                start=start,
+                end=end,
+                summary=_text_value(fields.get("SUMMARY", ("", ""))[1]),
+                description=_text_value(fields.get("DESCRIPTION", ("", ""))[1]),
+            )
+        )
+
+    return events
@@ -0,0 +1,161 @@
+"""Compact pickup schedule storage for GFA Abfallkalender."""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import date
+import sys
+from typing import NamedTuple
+
+
+class Pickup(NamedTuple):
+    """A single waste pickup."""
+
+    date: date
+    waste_type: str
+    summary: str
+    description: str
+
+
+class NextPickup(NamedTuple):
+    """The next pickup of a waste type, relative to a day."""
+
+    pickup: Pickup
+    days_until: int
+
+    @property
+    def is_today(self) -> bool:
+        """Return True if the pickup is today."""
+        return self.days_until == 0
+
+    @property
+    def is_tomorrow(self) -> bool:
+        """Return True if the pickup is tomorrow."""
+        return self.days_until == 1
+
+
+class PickupSchedule:
+    """Immutable, date-sorted list of pickups stored column-wise.
+
+    Dates are kept as ordinals in an array and waste types and texts as
+    codes into shared, interned string tables. Pickup records are only
+    created when they are read, so a schedule costs a few arrays instead of
+    one dict per pickup and waste type.
+
+    The sorted ordinals, overall and per waste type, double as the index
+    for date queries, which are bisect lookups instead of scans.
+    """
+
+    __slots__ = (
+        "_ordinals",
+        "_type_codes",
+        "_summary_codes",
+        "_description_codes",
+        "_type_names",
+        "_strings",
+        "_by_type",
+        "_type_ordinals",
+    )
+
+    def __init__(self, pickups: Iterable[Pickup] = ()) -> None:
+        """Build a schedule from pickups in any order."""
+        type_codes: dict[str, int] = {}
+        string_codes: dict[str, int] = {}
+        self._ordinals = array("i")
+        self._type_codes = array("B")
+        self._summary_codes = array("I")
+        self._description_codes = array("I")
+        by_type: dict[str, array] = {}
+
+        for index, pickup in enumerate(sorted(pickups, key=lambda p: p.date)):
+            self._ordinals.append(pickup.date.toordinal())
+            self._type_codes.append(
+                type_codes.setdefault(pickup.waste_type, len(type_codes))
+            )
+            self._summary_codes.append(
+                string_codes.setdefault(pickup.summary, len(string_codes))
+            )
+            self._description_codes.append(
+                string_codes.setdefault(pickup.description, len(string_codes))
+            )
+            by_type.setdefault(pickup.waste_type, array("I")).append(index)
+
+        self._type_names = tuple(sys.intern(name) for name in type_codes)
+        self._strings = tuple(string_codes)
+        self._by_type = {sys.intern(name): rows for name, rows in by_type.items()}
+        self._type_ordinals = {
+            name: array("i", (self._ordinals[index] for index in rows))
+            for name, rows in self._by_type.items()
+        }
+
+    def __len__(self) -> int:
+        """Return the number of pickups."""
+        return len(self._ordinals)
+
+    def __getitem__(self, index: int) -> Pickup:
+        """Return the pickup at a position."""
+        return Pickup(
+            date.fromordinal(self._ordinals[index]),
+            self._type_names[self._type_codes[index]],
+            self._strings[self._summary_codes[index]],
+            self._strings[self._description_codes[index]],
+        )
+
+    def __iter__(self) -> Iterator[Pickup]:
+        """Iterate over all pickups in date order."""
+        for index in range(len(self._ordinals)):
+            yield self[index]
+
+    @property
+    def waste_types(self) -> list[str]:
+        """Return the waste types in order of their first pickup."""
+        return list(self._by_type)
+
+    def of_type(self, waste_type: str) -> Iterator[Pickup]:
+        """Iterate over the pickups of one waste type in date order."""
+        for index in self._by_type.get(waste_type, ()):
+            yield self[index]
+
+    def next(self, day: date, waste_type: str | None = None) -> Pickup | None:
+        """Return the first pickup on or after a day."""
+        ordinal = day.toordinal()
+        if waste_type is None:
+            index = self.position(day)
+            return self[index] if index < len(self._ordinals) else None
+
+        ordinals = self._type_ordinals.get(waste_type)
+        if ordinals is None:
+            return None
+        position = bisect_left(ordinals, ordinal)
+        if position == len(ordinals):
+            return None
+        return self[self._by_type[waste_type][position]]
+
+    def position(self, day: date) -> int:
+        """Return the position of the first pickup on or after a day."""
+        return bisect_left(self._ordinals, day.toordinal())
+
+    def positions(self, start: date, end: date) -> range:
+        """Return the positions of the pickups from start to end inclusive."""
+        first = bisect_left(self._ordinals, start.toordinal())
+        return range(first, bisect_right(self._ordinals, end.toordinal(), lo=first))
+
+    def until(self, end: date) -> "PickupSchedule":
+        """Return the schedule without the pickups after end."""
+        last = bisect_right(self._ordinals, end.toordinal())
+        if last == len(self._ordinals):
+            return self
+        return PickupSchedule(self[index] for index in range(last))
+
+    def between(self, start: date, end: date) -> list[Pickup]:
+        """Return the pickups from start up to and including end."""
+        return [self[index] for index in self.positions(start, end)]
+
+    def on(self, day: date) -> list[Pickup]:
+        """Return the pickups of a single day."""
+        return self.between(day, day)
+
+    def upcoming(self, day: date, count: int) -> list[Pickup]:
+        """Return up to count pickups on or after a day."""
+        first = self.position(day)
+        last = min(first + max(count, 0), len(self._ordinals))
+        return [self[index] for index in range(first, last)]
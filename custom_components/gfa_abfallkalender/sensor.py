@@ -1,19 +1,29 @@
 """Sensor platform for GFA Abfallkalender."""
-from datetime import datetime
+from datetime import date
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    CONF_ATTRIBUTE_MODE,
+    CONF_RECORD_PICKUP_DETAILS,
+    ATTRIBUTE_MODE_COMPACT,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_RECORD_PICKUP_DETAILS,
+    CONF_UPCOMING_COUNT,
+    DEFAULT_UPCOMING_COUNT,
+    MAX_UPCOMING_COUNT,
     WASTE_TYPE_NAMES,
     WASTE_TYPE_ICONS,
 )
-from .coordinator import GFADataCoordinator
+from .coordinator import GFADataCoordinator, PickupChanges
+from .entity import GFACoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,8 +59,23 @@ async def async_setup_entry(
     # Add a general "next pickup" sensor
     entities.append(GFANextPickupSensor(coordinator, entry))
     
-    # Add "next 5 pickups" sensor for dashboard
-    entities.append(GFAUpcomingPickupsSensor(coordinator, entry))
+    # Add "next pickups" sensor for dashboard, optionally keeping the
+    # pickup details out of the recorder
+    config = hass.data[DOMAIN][entry.entry_id]["config"]
+    upcoming_sensor = (
+        GFAUpcomingPickupsSensor
+        if config.get(CONF_RECORD_PICKUP_DETAILS, DEFAULT_RECORD_PICKUP_DETAILS)
+        else GFAUnrecordedUpcomingPickupsSensor
+    )
+    entities.append(
+        upcoming_sensor(
+            coordinator,
+            entry,
+            compact=config.get(CONF_ATTRIBUTE_MODE, DEFAULT_ATTRIBUTE_MODE)
+            == ATTRIBUTE_MODE_COMPACT,
+            count=int(config.get(CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT)),
+        )
+    )
 
     # Add sensors for each waste type
     waste_types = coordinator.get_all_waste_types()
@@ -60,7 +85,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GFANextPickupSensor(CoordinatorEntity, SensorEntity):
+class GFANextPickupSensor(GFACoordinatorEntity, SensorEntity):
     """Sensor for the next waste pickup."""
 
     _attr_device_class = SensorDeviceClass.DATE
@@ -77,35 +102,39 @@ class GFANextPickupSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_next_pickup"
         self._attr_name = "GFA Nächste Abholung"
 
+    def _is_affected(self, changes: PickupChanges) -> bool:
+        """Return True if the next pickup or its countdown changed."""
+        return None in changes.waste_types or changes.day
+
     @property
     def native_value(self):
         """Return the next pickup date."""
-        pickup = self.coordinator.get_next_pickup()
-        if pickup:
-            return pickup["date"]
+        state = self.coordinator.get_next_pickup_state()
+        if state:
+            return state.pickup.date
         return None
 
     @property
     def extra_state_attributes(self):
         """Return additional attributes."""
-        pickup = self.coordinator.get_next_pickup()
-        if pickup:
-            days_until = (pickup["date"] - datetime.now().date()).days
+        state = self.coordinator.get_next_pickup_state()
+        if state:
+            pickup = state.pickup
             return {
-                "waste_type": pickup["waste_type"],
+                "waste_type": pickup.waste_type,
                 "waste_type_name": WASTE_TYPE_NAMES.get(
-                    pickup["waste_type"], pickup["summary"]
+                    pickup.waste_type, pickup.summary
                 ),
-                "summary": pickup["summary"],
-                "days_until": days_until,
-                "is_tomorrow": days_until == 1,
-                "is_today": days_until == 0,
+                "summary": pickup.summary,
+                "days_until": state.days_until,
+                "is_tomorrow": state.is_tomorrow,
+                "is_today": state.is_today,
             }
         return {}
 
 
-class GFAUpcomingPickupsSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing the next 5 upcoming waste pickups."""
+class GFAUpcomingPickupsSensor(GFACoordinatorEntity, SensorEntity):
+    """Sensor showing the next upcoming waste pickups."""
 
     _attr_icon = "mdi:calendar-check"
 
@@ -113,32 +142,47 @@ class GFAUpcomingPickupsSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: GFADataCoordinator,
         entry: ConfigEntry,
+        compact: bool = False,
+        count: int = DEFAULT_UPCOMING_COUNT,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
+        self._compact = compact
+        self._count = min(count, MAX_UPCOMING_COUNT)
         self._attr_unique_id = f"{entry.entry_id}_upcoming_pickups"
         self._attr_name = "GFA Kommende Termine"
+        self._attributes_key: tuple[int, date] | None = None
+        self._attributes: dict[str, Any] = {}
+
+    def _is_affected(self, changes: PickupChanges) -> bool:
+        """Return True if the schedule or the day changed."""
+        return changes.schedule or changes.day
 
     @property
     def native_value(self):
         """Return the count of upcoming pickups."""
         if self.coordinator.data:
-            events = self.coordinator.data.get("events", [])
-            today = datetime.now().date()
-            upcoming = [e for e in events if e["date"] >= today][:5]
-            return len(upcoming)
+            return self.extra_state_attributes["pickup_count"]
         return 0
 
     @property
     def extra_state_attributes(self):
-        """Return the next 5 pickups as attributes."""
+        """Return the next pickups as attributes."""
         if not self.coordinator.data:
             return {}
-        
-        events = self.coordinator.data.get("events", [])
-        today = datetime.now().date()
-        upcoming = [e for e in events if e["date"] >= today][:5]
+
+        # The attributes only change with new data or a new day
+        key = (self.coordinator.data_version, dt_util.now().date())
+        if key != self._attributes_key:
+            self._attributes = self._build_attributes(key[1])
+            self._attributes_key = key
+        return self._attributes
+
+    def _build_attributes(self, today: date) -> dict[str, Any]:
+        """Build the attributes for the pickups from today on."""
+        # Bisect to today's position and slice, independent of the schedule size
+        upcoming = self.coordinator.schedule.upcoming(today, self._count)
         
         attributes = {
             "pickups": [],
@@ -148,9 +192,9 @@ class GFAUpcomingPickupsSensor(CoordinatorEntity, SensorEntity):
         # German weekday names
         weekdays_de = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
         
-        for i, event in enumerate(upcoming, 1):
-            waste_type = event.get("waste_type", "unknown")
-            event_date = event["date"]
+        for i, pickup in enumerate(upcoming, 1):
+            waste_type = pickup.waste_type
+            event_date = pickup.date
             days_until = (event_date - today).days
             
             # Format date nicely
@@ -174,12 +218,18 @@ class GFAUpcomingPickupsSensor(CoordinatorEntity, SensorEntity):
                 "tage_bis": days_until,
                 "tag_beschreibung": day_desc,
                 "abfallart": waste_type,
-                "abfallart_name": WASTE_TYPE_NAMES.get(waste_type, event.get("summary", waste_type)),
-                "icon": WASTE_TYPE_ICONS.get(waste_type, "mdi:trash-can"),
-                "emoji": WASTE_TYPE_EMOJIS.get(waste_type, "📦"),
-                "beschreibung": event.get("summary", ""),
+                "abfallart_name": WASTE_TYPE_NAMES.get(waste_type, pickup.summary or waste_type),
+                "beschreibung": pickup.summary,
             }
             attributes["pickups"].append(pickup_data)
+
+            # Compact mode: icon and emoji follow from the waste type and
+            # the flat keys repeat the list
+            if self._compact:
+                continue
+
+            pickup_data["icon"] = WASTE_TYPE_ICONS.get(waste_type, "mdi:trash-can")
+            pickup_data["emoji"] = WASTE_TYPE_EMOJIS.get(waste_type, "📦")
             
             # Also add as individual attributes for easier template access
             attributes[f"termin_{i}_datum"] = date_str
@@ -191,7 +241,20 @@ class GFAUpcomingPickupsSensor(CoordinatorEntity, SensorEntity):
         return attributes
 
 
-class GFAWasteTypeSensor(CoordinatorEntity, SensorEntity):
+class GFAUnrecordedUpcomingPickupsSensor(GFAUpcomingPickupsSensor):
+    """Upcoming pickups sensor that keeps the pickup details out of the recorder."""
+
+    _unrecorded_attributes = frozenset(
+        {"pickups"}
+        | {
+            f"termin_{i}_{field}"
+            for i in range(1, MAX_UPCOMING_COUNT + 1)
+            for field in ("datum", "typ", "emoji", "tage", "icon")
+        }
+    )
+
+
+class GFAWasteTypeSensor(GFACoordinatorEntity, SensorEntity):
     """Sensor for a specific waste type."""
 
     _attr_device_class = SensorDeviceClass.DATE
@@ -210,25 +273,28 @@ class GFAWasteTypeSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"GFA {WASTE_TYPE_NAMES.get(waste_type, waste_type)}"
         self._attr_icon = WASTE_TYPE_ICONS.get(waste_type, "mdi:trash-can")
 
+    def _is_affected(self, changes: PickupChanges) -> bool:
+        """Return True if this type's next pickup or its countdown changed."""
+        return self._waste_type in changes.waste_types or changes.day
+
     @property
     def native_value(self):
         """Return the next pickup date for this waste type."""
-        pickup = self.coordinator.get_next_pickup(self._waste_type)
-        if pickup:
-            return pickup["date"]
+        state = self.coordinator.get_next_pickup_state(self._waste_type)
+        if state:
+            return state.pickup.date
         return None
 
     @property
     def extra_state_attributes(self):
         """Return additional attributes."""
-        pickup = self.coordinator.get_next_pickup(self._waste_type)
-        if pickup:
-            days_until = (pickup["date"] - datetime.now().date()).days
+        state = self.coordinator.get_next_pickup_state(self._waste_type)
+        if state:
             return {
-                "summary": pickup["summary"],
-                "days_until": days_until,
-                "is_tomorrow": days_until == 1,
-                "is_today": days_until == 0,
+                "summary": state.pickup.summary,
+                "days_until": state.days_until,
+                "is_tomorrow": state.is_tomorrow,
+                "is_today": state.is_today,
                 "emoji": WASTE_TYPE_EMOJIS.get(self._waste_type, "📦"),
             }
         return {}
@@ -0,0 +1,89 @@
+"""Minimal stand-ins for Home Assistant modules.
+
+Lets the integration modules be imported without Home Assistant installed,
+e.g. to measure their import time. Every homeassistant.* module exists and
+every name in it is a stub class that can be subclassed, parametrized,
+combined with | and used as a decorator. Nothing is functional.
+"""
+import importlib
+import importlib.abc
+import importlib.machinery
+from pathlib import Path
+import sys
+import types
+
+
+class _StubMeta(type):
+    """Metaclass answering every class attribute with a stub."""
+
+    def __getattr__(cls, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _stub(f"{cls.__name__}.{name}")
+
+    def __getitem__(cls, item):
+        return cls
+
+    def __or__(cls, other):
+        return cls
+
+    def __ror__(cls, other):
+        return cls
+
+    def __call__(cls, *args, **kwargs):
+        # Used as a decorator: hand the decorated object back
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+        return super().__call__()
+
+
+class _Stub(metaclass=_StubMeta):
+    """Base of all stub classes."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Accept class keywords like ConfigFlow's domain."""
+
+
+def _stub(name: str) -> type:
+    return _StubMeta(name, (_Stub,), {})
+
+
+class _StubModule(types.ModuleType):
+    """Module whose missing attributes are stub classes."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _stub(name)
+        setattr(self, name, value)
+        return value
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve a stub module for homeassistant and all its submodules."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname == "homeassistant" or fullname.startswith("homeassistant."):
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        return _StubModule(spec.name)
+
+    def exec_module(self, module) -> None:
+        module.__path__ = []
+
+
+def install() -> None:
+    """Make homeassistant importable as stubs."""
+    if not any(isinstance(finder, _StubFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _StubFinder())
+
+
+def import_integration(module: str) -> types.ModuleType:
+    """Import a module of the integration with Home Assistant stubbed."""
+    components = str(Path(__file__).resolve().parents[1] / "custom_components")
+    if components not in sys.path:
+        sys.path.insert(0, components)
+    install()
+    return importlib.import_module(f"gfa_abfallkalender.{module}")
@@ -0,0 +1,103 @@
+"""Sample calendars shaped like the GFA portal's ICS downloads.
+
+The portal serves one VCALENDAR per year with an explicitly dated,
+all-day VEVENT per pickup. The generated feeds follow that layout,
+including folded DESCRIPTION lines, escaped text and volatile DTSTAMP and
+UID properties, so the benchmarks see realistic input.
+"""
+from datetime import date, timedelta
+
+# (summary, first pickup in January, weeks between pickups)
+PICKUPS = [
+    ("Restmüll 14-tägig", 2, 2),
+    ("Bioabfall", 3, 1),
+    ("Altpapier / Papiertonne", 8, 4),
+    ("Gelber Sack", 9, 2),
+    ("Grünabfall, Laub und Gartenabfall", 15, 4),
+    ("Sperrmüll / Altmetall", 20, 13),
+]
+CHRISTMAS_TREES = "Weihnachtsbaum-Abholung"
+
+_DESCRIPTION = (
+    "Bitte stellen Sie die Behälter bis 6:00 Uhr an den Straßenrand\\, "
+    "gut sichtbar und mit geschlossenem Deckel. Weitere Informationen "
+    "unter https://www.gfa-lueneburg.de"
+)
+
+
+def _fold(line: str) -> list[str]:
+    """Fold a content line at 75 characters like the portal does."""
+    lines = [line[:75]]
+    line = line[75:]
+    while line:
+        lines.append(" " + line[:74])
+        line = line[74:]
+    return lines
+
+
+def _event(uid: str, day: date, summary: str, house_number: str) -> list[str]:
+    """Return the content lines of one pickup."""
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid}-{house_number}@gfa-lueneburg.de",
+        "DTSTAMP:20260105T061500Z",
+        f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{summary}",
+        *_fold(f"DESCRIPTION:{summary}: {_DESCRIPTION}"),
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+
+
+def year_feed(year: int, house_number: str = "1") -> str:
+    """Return the ICS download of one year for an address."""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Athos//AbfuhrTerminModel//DE",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:Abfuhrtermine",
+    ]
+    for index, (summary, first_day, weeks) in enumerate(PICKUPS):
+        day = date(year, 1, first_day)
+        count = 0
+        while day.year == year:
+            lines.extend(_event(f"{year}-{index}-{count}", day, summary, house_number))
+            day += timedelta(weeks=weeks)
+            count += 1
+    lines.extend(
+        _event(f"{year}-tree", date(year, 1, 12), CHRISTMAS_TREES, house_number)
+    )
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def recurring_year_feed(year: int) -> str:
+    """Return a feed of one year that describes the pickups with RRULEs."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Sample//DE"]
+    for index, (summary, first_day, weeks) in enumerate(PICKUPS):
+        day = date(year, 1, first_day)
+        lines.extend(
+            [
+                "BEGIN:VEVENT",
+                f"UID:rrule-{year}-{index}@example.org",
+                "DTSTAMP:20260105T061500Z",
+                f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+                f"RRULE:FREQ=WEEKLY;INTERVAL={weeks};UNTIL={year}1231",
+                f"SUMMARY:{summary}",
+                "END:VEVENT",
+            ]
+        )
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def read_feed(ics, text: str, chunk_size: int = 16384):
+    """Stream ICS text through the integration's reader like a download."""
+    reader = ics.IcsStreamReader()
+    for start in range(0, len(text), chunk_size):
+        reader.feed(text[start : start + chunk_size])
+    return reader.close()
@@ -0,0 +1,181 @@
+"""Compare calendar queries with cached events against rebuilding them.
+
+Runs the queries the calendar card and automations make against
+GFACalendarEntity over a two-year schedule:
+
+- rebuilt per call: a CalendarEvent is built for every pickup in the
+  range on each call, as the entity did before the cache (reference)
+- cached slices (current): the entity slices the events it built once
+  per data version
+
+The month view asks for each month of both years, the year view for each
+year, and the next event is read for every day. Both ways must return
+equal events.
+
+Home Assistant's CalendarEvent is replaced by a dataclass with its fields,
+so the numbers leave out the cost of Home Assistant's own validation.
+
+Usage: python scripts/bench_calendar_views.py [--number N]
+"""
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import sys
+import timeit
+import types
+
+import _ha_stubs
+import _sample_feeds
+
+calendar = _ha_stubs.import_integration("calendar")
+coordinator = _ha_stubs.import_integration("coordinator")
+ics = _ha_stubs.import_integration("ics")
+
+YEARS = (2026, 2027)
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    """Stand-in for homeassistant.components.calendar.CalendarEvent."""
+
+    start: date
+    end: date
+    summary: str
+    description: str | None = None
+    location: str | None = None
+
+
+class _Clock:
+    """Stand-in for homeassistant.util.dt with a settable time."""
+
+    def __init__(self) -> None:
+        self.current = datetime(YEARS[0], 1, 1, 12)
+
+    def now(self) -> datetime:
+        return self.current
+
+
+calendar.CalendarEvent = CalendarEvent
+clock = calendar.dt_util = _Clock()
+
+
+def _schedule():
+    feed = _sample_feeds.read_feed(ics, _sample_feeds.year_feed(YEARS[0]))
+    for year in YEARS[1:]:
+        feed = feed.merge(_sample_feeds.read_feed(ics, _sample_feeds.year_feed(year)))
+    return coordinator._parse_calendar(
+        feed, date(YEARS[0], 1, 1), date(YEARS[-1] + 1, 1, 1)
+    )
+
+
+def _entity(schedule):
+    """Return a calendar entity on a coordinator that only holds data."""
+    entity = calendar.GFACalendarEntity.__new__(calendar.GFACalendarEntity)
+    entity.coordinator = types.SimpleNamespace(
+        schedule=schedule, data={"schedule": schedule}, data_version=1
+    )
+    entity._events = []
+    entity._events_version = None
+    return entity
+
+
+def _result(coroutine):
+    """Run a coroutine that never suspends."""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("Coroutine suspended")
+
+
+def _build(pickup) -> CalendarEvent:
+    return CalendarEvent(
+        start=pickup.date,
+        end=pickup.date + timedelta(days=1),
+        summary=pickup.summary,
+        description=pickup.description,
+    )
+
+
+def _rebuilt_events(schedule, start: datetime, end: datetime) -> list:
+    return [_build(pickup) for pickup in schedule.between(start.date(), end.date())]
+
+
+def _rebuilt_event(schedule):
+    pickup = schedule.next(clock.now().date())
+    return _build(pickup) if pickup else None
+
+
+def _month_ranges() -> list:
+    months = [datetime(year, month, 1) for year in YEARS for month in range(1, 13)]
+    return list(zip(months, [*months[1:], datetime(YEARS[-1] + 1, 1, 1)]))
+
+
+def _year_ranges() -> list:
+    return [(datetime(year, 1, 1), datetime(year + 1, 1, 1)) for year in YEARS]
+
+
+def main() -> int:
+    """Run the comparison and the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    number = parser.parse_args().number
+
+    schedule = _schedule()
+    entity = _entity(schedule)
+    build_time = timeit.timeit(
+        lambda: _entity(schedule)._calendar_events(), number=number
+    ) / number
+    print(
+        f"{len(schedule)} pickups, building the cached events takes "
+        f"{build_time * 1e3:.2f}ms per data version"
+    )
+
+    def view(ranges):
+        return (
+            lambda: [_rebuilt_events(schedule, *r) for r in ranges],
+            lambda: [_result(entity.async_get_events(None, *r)) for r in ranges],
+            len(ranges),
+        )
+
+    days = [datetime(YEARS[0], 1, 1, 12) + timedelta(days=n) for n in range(730)]
+
+    def next_event(read):
+        def run():
+            events = []
+            for day in days:
+                clock.current = day
+                events.append(read())
+            return events
+
+        return run
+
+    queries = {
+        "month view": view(_month_ranges()),
+        "year view": view(_year_ranges()),
+        "next event": (
+            next_event(lambda: _rebuilt_event(schedule)),
+            next_event(lambda: entity.event),
+            len(days),
+        ),
+    }
+
+    failures = 0
+    print(f"{'query':<12} {'rebuilt per call':>17} {'cached slices':>14} {'speedup':>8}")
+    for name, (rebuilt, cached, calls) in queries.items():
+        if rebuilt() != cached():
+            print(f"{name:<12} MISMATCH")
+            failures += 1
+            continue
+        rebuilt_time = timeit.timeit(rebuilt, number=number) / (number * calls)
+        cached_time = timeit.timeit(cached, number=number) / (number * calls)
+        print(
+            f"{name:<12} {rebuilt_time * 1e6:>15.1f}us {cached_time * 1e6:>12.1f}us "
+            f"{rebuilt_time / cached_time:>7.1f}x"
+        )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
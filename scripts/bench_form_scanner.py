@@ -0,0 +1,130 @@
+"""Compare FormScanner with the HiddenInputParser reference.
+
+Runs both parsers over representative servlet pages, checks that they
+extract the same data and reports how long each takes per page.
+
+Usage: python scripts/bench_form_scanner.py [--number N]
+"""
+import argparse
+import importlib
+from pathlib import Path
+import sys
+import timeit
+import types
+
+COMPONENT_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "gfa_abfallkalender"
+
+
+def _load_api() -> types.ModuleType:
+    """Import the API module without running the integration's __init__."""
+    package = types.ModuleType("gfa_abfallkalender")
+    package.__path__ = [str(COMPONENT_DIR)]
+    sys.modules[package.__name__] = package
+    return importlib.import_module("gfa_abfallkalender.api")
+
+
+def _hidden(name: str, value: str) -> str:
+    return f'<input type="hidden" name="{name}" value="{value}">'
+
+
+def _select(name: str, values: list[str]) -> str:
+    options = "".join(
+        f'<option value="{value}">{value.replace(" ", "&nbsp;")}</option>'
+        for value in values
+    )
+    return f'<select name="{name}" onchange="submit()"><option value=""></option>{options}</select>'
+
+
+def _servlet_page(selects: str, extra_hidden: int = 12) -> str:
+    """Build a page like the servlet's, with a site search before the form."""
+    hidden = "".join(_hidden(f"Field{i}", f"value {i}") for i in range(extra_hidden))
+    return (
+        "<!DOCTYPE html><html><head><title>GFA Lüneburg</title>"
+        "<script>var t = '<input type=\"hidden\" name=\"js\" value=\"x\">';</script>"
+        "</head><body>"
+        '<div class="header"><form action="/suche">'
+        f'{_hidden("SiteSearch", "1")}<input type="text" name="q"></form></div>'
+        "<!-- <input type=\"hidden\" name=\"Commented\" value=\"x\"> -->"
+        '<form method="post" action="WasteManagementServlet">'
+        f'{_hidden("SessionId", "0123456789ABCDEF")}'
+        f'{_hidden("ApplicationName", "com.athos.kd.lueneburg.AbfuhrTerminModel")}'
+        f'{_hidden("SubmitAction", "wasteDisposalServices")}'
+        f"{hidden}"
+        '<table><tr><td>Zeitraum</td><td><select name="Zeitraum">'
+        '<option value="Jahresübersicht 2026">2026</option></select></td></tr>'
+        f"<tr><td>{selects}</td></tr></table>"
+        "</form>"
+        + "<p>Hinweise zur Abfuhr &amp; Entsorgung.</p>" * 40
+        + '<div class="footer"><form action="/newsletter">'
+        f'{_hidden("Newsletter", "1")}</form></div>'
+        "</body></html>"
+    )
+
+
+CITIES = [f"Ort {i}" for i in range(30)]
+STREETS = [f"Straße {i}" for i in range(600)]
+HOUSE_NUMBERS = [f"{i}{suffix}" for i in range(1, 150) for suffix in ("", "a")]
+
+PAGES = {
+    "initial": _servlet_page(_select("Ort", CITIES)),
+    "city changed": _servlet_page(
+        _select("Ort", CITIES) + _select("Strasse", STREETS)
+    ),
+    "street changed": _servlet_page(
+        _select("Ort", CITIES)
+        + _select("Strasse", STREETS)
+        + _select("Hausnummer", HOUSE_NUMBERS)
+    ),
+    "form after another form": (
+        f'<form>{_hidden("q", "x")}</form>'
+        f'<form>{_hidden("b", "y")}{_select("Strasse", STREETS[:5])}</form>'
+    ),
+    "hidden input after the form": (
+        f'<form>{_hidden("a", "1")}{_select("Ort", CITIES[:3])}</form>'
+        f'{_hidden("late", "2")}'
+    ),
+}
+
+
+def _extract(parser) -> tuple:
+    return parser.args, parser.cities, parser.streets, parser.house_numbers
+
+
+def main() -> int:
+    """Run the comparison and the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--number", type=int, default=200)
+    number = arg_parser.parse_args().number
+
+    api = _load_api()
+
+    def scan(page: str):
+        scanner = api.FormScanner()
+        scanner.feed(page)
+        return scanner
+
+    def reference(page: str):
+        parser = api.HiddenInputParser()
+        parser.feed(page)
+        parser.close()
+        return parser
+
+    failures = 0
+    print(f"{'page':<28} {'bytes':>7} {'reference':>11} {'scanner':>11} {'speedup':>8}")
+    for name, page in PAGES.items():
+        if _extract(scan(page)) != _extract(reference(page)):
+            print(f"{name:<28} MISMATCH")
+            failures += 1
+            continue
+        reference_time = timeit.timeit(lambda: reference(page), number=number) / number
+        scan_time = timeit.timeit(lambda: scan(page), number=number) / number
+        print(
+            f"{name:<28} {len(page):>7} {reference_time * 1e6:>9.0f}us "
+            f"{scan_time * 1e6:>9.0f}us {reference_time / scan_time:>7.1f}x"
+        )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Compare request sequences for refreshing an address.
+
+The portal is replaced by a fake that answers every request after a fixed
+round-trip time, so the numbers show how many requests each strategy
+sends and how many round trips a refresh waits for:
+
+- resolved once: the wizard is walked once and both years are forwarded
+  and downloaded one after another in the same servlet session (current)
+- two pipelines: each year walks the whole wizard in its own session and
+  both run concurrently
+
+It then refreshes one address of a street with many registered addresses
+through get_calendar_feed, which runs a street batch, and checks that the
+refresh succeeds within the refresh budget.
+
+Usage: python scripts/bench_refresh_pipeline.py [--rtt-ms MS]
+           [--house-numbers N] [--refresh-timeout S]
+"""
+import argparse
+import asyncio
+import time
+
+import _ha_stubs
+import _sample_feeds
+
+api = _ha_stubs.import_integration("api")
+ics = _ha_stubs.import_integration("ics")
+
+CITY = "Lüneburg"
+STREET = "Am Sande"
+YEARS = (2026, 2027)
+
+_FORM_PAGE = (
+    '<form method="post"><input type="hidden" name="SessionId" value="1">'
+    '<input type="hidden" name="SubmitAction" value="wasteDisposalServices">'
+    "</form>"
+)
+
+
+class _FakeSession:
+    """Stand-in for a pipeline session that remembers the chosen year."""
+
+    closed = False
+    year = None
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakePortalAPI(api.GFALueneburgAPI):
+    """API client whose requests take a fixed time and never fail."""
+
+    def __init__(self, rtt: float, refresh_timeout: float = 120) -> None:
+        super().__init__(refresh_timeout=refresh_timeout)
+        self.rtt = rtt
+        self.requests = 0
+        self._feeds = {
+            year: _sample_feeds.read_feed(ics, _sample_feeds.year_feed(year))
+            for year in YEARS
+        }
+
+    async def _new_pipeline_session(self):
+        return _FakeSession()
+
+    async def _request(self, session, method, *, params=None, data=None, read=None):
+        self.requests += 1
+        await asyncio.sleep(self.rtt)
+        if read is api.async_read_ics_feed:
+            return self._feeds[session.year]
+        if data and "Zeitraum" in data:
+            session.year = int(data["Zeitraum"][-4:])
+        return _FORM_PAGE
+
+
+async def _resolved_once(client: FakePortalAPI) -> dict:
+    results = await client._run_street_pipeline(CITY, STREET, ["1"], YEARS)
+    return results["1"]
+
+
+async def _two_pipelines(client: FakePortalAPI) -> dict:
+    results = await asyncio.gather(
+        *(
+            client._run_street_pipeline(CITY, STREET, ["1"], (year,))
+            for year in YEARS
+        )
+    )
+    return {year: result["1"][year] for year, result in zip(YEARS, results)}
+
+
+STRATEGIES = {
+    "resolved once (current)": _resolved_once,
+    "two pipelines": _two_pipelines,
+}
+
+
+async def _run_street(rtt: float, house_numbers: int, refresh_timeout: float) -> int:
+    unregister = [
+        api.register_address(CITY, STREET, str(number))
+        for number in range(1, house_numbers + 1)
+    ]
+    client = FakePortalAPI(rtt, refresh_timeout)
+    started = time.perf_counter()
+    try:
+        feed = await client.get_calendar_feed(CITY, STREET, "1")
+    except api.GFAApiError as err:
+        print(f"street refresh FAILED after {client.requests} requests: {err}")
+        return 1
+    finally:
+        elapsed = time.perf_counter() - started
+        kept = api._STREET_CALENDARS.get((CITY, STREET))
+        kept = len(kept.house_numbers) if kept else 0
+        for callback in unregister:
+            callback()
+    print(
+        f"street refresh of 1 of {house_numbers} addresses: {len(feed.events)} "
+        f"events, {client.requests} requests, {elapsed * 1000:.0f}ms, "
+        f"{kept} neighbour calendars kept"
+    )
+    return 0
+
+
+async def _run(rtt: float) -> int:
+    failures = 0
+    print(f"{'strategy':<26} {'requests':>8} {'round trips':>12} {'time':>9}")
+    for name, strategy in STRATEGIES.items():
+        client = FakePortalAPI(rtt)
+        started = time.perf_counter()
+        results = await strategy(client)
+        elapsed = time.perf_counter() - started
+        if sorted(results) != list(YEARS) or any(
+            isinstance(result, Exception) for result in results.values()
+        ):
+            print(f"{name:<26} FAILED {results}")
+            failures += 1
+            continue
+        print(
+            f"{name:<26} {client.requests:>8} {elapsed / rtt:>12.1f} "
+            f"{elapsed * 1000:>7.0f}ms"
+        )
+    return failures
+
+
+def main() -> int:
+    """Run all strategies against the fake portal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=50)
+    parser.add_argument("--house-numbers", type=int, default=20)
+    parser.add_argument("--refresh-timeout", type=float, default=120)
+    args = parser.parse_args()
+    rtt = args.rtt_ms / 1000
+    failures = asyncio.run(_run(rtt))
+    failures += asyncio.run(
+        _run_street(rtt, args.house_numbers, args.refresh_timeout)
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+"""Compare parsing a feed with and without recurrence expansion.
+
+Parses two-year feeds shaped like the portal's downloads over a refresh
+window, the way the coordinator does:
+
+- full expansion: icalendar tree expanded with recurring_ical_events, as
+  every refresh did before the fast path (reference)
+- icalendar, no expansion: the icalendar fallback for feeds without
+  RRULE, RDATE or EXDATE
+- tokenizer (current): the fast path for feeds without recurrences
+
+Each path must yield the same pickups as full expansion. A feed with
+RRULEs must make the coordinator fall back to full expansion.
+
+Requires icalendar and recurring_ical_events from the manifest.
+
+Usage: python scripts/bench_rrule_fast_path.py [--number N]
+"""
+import argparse
+from datetime import date, timedelta
+import sys
+import timeit
+
+import _ha_stubs
+import _sample_feeds
+
+try:
+    from icalendar import Calendar
+    import recurring_ical_events
+except ImportError as err:
+    sys.exit(f"{err.name} is required, install the manifest requirements")
+
+coordinator = _ha_stubs.import_integration("coordinator")
+ics = _ha_stubs.import_integration("ics")
+
+START = date(2026, 3, 1)
+END = START + timedelta(days=365) + coordinator.PARSE_WINDOW_SLACK
+
+
+def _full_expansion(feed, start: date, end: date) -> list:
+    """Parse like the coordinator did before the fast path."""
+    calendar = Calendar.from_ical(feed.to_ical())
+    events = []
+    for event in recurring_ical_events.of(calendar).between(start, end):
+        if (pickup := coordinator._parse_event(event)) is not None:
+            events.append(pickup)
+    return events
+
+
+STRATEGIES = {
+    "full expansion": _full_expansion,
+    "icalendar, no expansion": coordinator._parse_with_icalendar,
+    "tokenizer (current)": coordinator._parse_tokens,
+}
+
+
+def _two_year_feed(first: str, second: str):
+    return _sample_feeds.read_feed(ics, first).merge(
+        _sample_feeds.read_feed(ics, second)
+    )
+
+
+FEEDS = {
+    "portal, 2026 + 2027": _two_year_feed(
+        _sample_feeds.year_feed(2026), _sample_feeds.year_feed(2027)
+    ),
+    "portal, 2026 + 2027, no. 12a": _two_year_feed(
+        _sample_feeds.year_feed(2026, "12a"), _sample_feeds.year_feed(2027, "12a")
+    ),
+}
+RECURRING_FEED = _two_year_feed(
+    _sample_feeds.recurring_year_feed(2026), _sample_feeds.recurring_year_feed(2027)
+)
+
+
+def main() -> int:
+    """Run the comparison and the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    number = parser.parse_args().number
+
+    failures = 0
+    for feed_name, feed in FEEDS.items():
+        reference = sorted(_full_expansion(feed, START, END))
+        print(f"{feed_name}: {len(feed.events)} events, {len(reference)} in window")
+        times = {}
+        for name, strategy in STRATEGIES.items():
+            if sorted(strategy(feed, START, END)) != reference:
+                print(f"  {name:<26} MISMATCH")
+                failures += 1
+                continue
+            times[name] = (
+                timeit.timeit(lambda: strategy(feed, START, END), number=number)
+                / number
+            )
+            print(
+                f"  {name:<26} {times[name] * 1000:>8.2f}ms "
+                f"{times['full expansion'] / times[name]:>7.1f}x"
+            )
+
+    # Recurring feeds have to take the expanding path
+    reference = sorted(_full_expansion(RECURRING_FEED, START, END))
+    parsed = sorted(coordinator._parse_calendar(RECURRING_FEED, START, END))
+    status = "ok" if parsed == reference else "MISMATCH"
+    print(f"recurring feed: {len(reference)} occurrences in window, fallback {status}")
+    if parsed != reference:
+        failures += 1
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
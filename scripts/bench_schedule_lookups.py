@@ -0,0 +1,122 @@
+"""Compare PickupSchedule lookups with linear scans over all pickups.
+
+Builds schedules of several years, with one or more entries per pickup,
+and runs the queries sensors and calendar make on every state write:
+
+- linear scan: filter and sort the full pickup list, as the coordinator
+  did before the schedule was indexed (reference)
+- bisect (current): PickupSchedule's sorted ordinal indexes
+
+Every query is run for each day of the first year and must give the same
+result both ways.
+
+Usage: python scripts/bench_schedule_lookups.py [--number N]
+"""
+import argparse
+from datetime import date, timedelta
+import sys
+import timeit
+
+import _ha_stubs
+import _sample_feeds
+
+coordinator = _ha_stubs.import_integration("coordinator")
+ics = _ha_stubs.import_integration("ics")
+schedule = _ha_stubs.import_integration("schedule")
+
+FIRST_YEAR = 2026
+UPCOMING_COUNT = 10
+RANGE = timedelta(days=30)
+
+
+def _pickups(years: int, entries: int) -> list:
+    """Parse the portal feeds of several years, each pickup entries times."""
+    feed = _sample_feeds.read_feed(ics, _sample_feeds.year_feed(FIRST_YEAR))
+    for year in range(FIRST_YEAR + 1, FIRST_YEAR + years):
+        feed = feed.merge(_sample_feeds.read_feed(ics, _sample_feeds.year_feed(year)))
+    pickups = coordinator._parse_tokens(feed, date.min, date.max)
+    return [
+        pickup._replace(summary=f"{pickup.summary} ({entry})") if entry else pickup
+        for pickup in pickups
+        for entry in range(entries)
+    ]
+
+
+class LinearScan:
+    """The pickup queries as linear scans over a date-sorted list."""
+
+    def __init__(self, pickups: list) -> None:
+        self._pickups = sorted(pickups, key=lambda pickup: pickup.date)
+        self.waste_types = list(dict.fromkeys(p.waste_type for p in self._pickups))
+
+    def next(self, day: date, waste_type: str | None = None):
+        upcoming = [
+            pickup
+            for pickup in self._pickups
+            if pickup.date >= day
+            and (waste_type is None or pickup.waste_type == waste_type)
+        ]
+        return min(upcoming, key=lambda pickup: pickup.date, default=None)
+
+    def on(self, day: date) -> list:
+        return [pickup for pickup in self._pickups if pickup.date == day]
+
+    def between(self, start: date, end: date) -> list:
+        return [pickup for pickup in self._pickups if start <= pickup.date <= end]
+
+    def upcoming(self, day: date, count: int) -> list:
+        return sorted(
+            (pickup for pickup in self._pickups if pickup.date >= day),
+            key=lambda pickup: pickup.date,
+        )[:count]
+
+
+QUERIES = {
+    "next": lambda pickups, day: pickups.next(day),
+    "next of each type": lambda pickups, day: [
+        pickups.next(day, waste_type) for waste_type in pickups.waste_types
+    ],
+    "on": lambda pickups, day: pickups.on(day),
+    "between, 30 days": lambda pickups, day: pickups.between(day, day + RANGE),
+    "upcoming": lambda pickups, day: pickups.upcoming(day, UPCOMING_COUNT),
+}
+
+# (years, entries per pickup)
+DATASETS = [(1, 1), (2, 1), (5, 1), (5, 4), (10, 4)]
+
+
+def main() -> int:
+    """Run the comparison and the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=3)
+    number = parser.parse_args().number
+
+    days = [date(FIRST_YEAR, 1, 1) + timedelta(days=n) for n in range(365)]
+    failures = 0
+    for years, entries in DATASETS:
+        pickups = _pickups(years, entries)
+        linear = LinearScan(pickups)
+        indexed = schedule.PickupSchedule(pickups)
+        print(f"{years} years, {entries} entries per pickup: {len(pickups)} pickups")
+        for name, query in QUERIES.items():
+            if any(query(linear, day) != query(indexed, day) for day in days):
+                print(f"  {name:<20} MISMATCH")
+                failures += 1
+                continue
+            times = [
+                timeit.timeit(
+                    lambda: [query(pickups, day) for day in days], number=number
+                )
+                / (number * len(days))
+                for pickups in (linear, indexed)
+            ]
+            print(
+                f"  {name:<20} {times[0] * 1e6:>9.1f}us {times[1] * 1e6:>7.1f}us "
+                f"{times[0] / times[1]:>7.1f}x"
+            )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
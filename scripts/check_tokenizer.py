@@ -0,0 +1,202 @@
+"""Check the ICS tokenizer against icalendar.
+
+Reads sample feeds through the integration's stream reader and checks
+that tokenize_events extracts the same UID, dates, summary and
+description as icalendar does for every VEVENT, and that the coordinator's
+fast path yields the same pickups as its icalendar fallback. Feeds the
+tokenizer must not handle have to raise IcsUnsupported, so the
+coordinator falls back to icalendar.
+
+Requires icalendar and recurring_ical_events from the manifest.
+
+Usage: python scripts/check_tokenizer.py
+"""
+from datetime import date, datetime
+import sys
+
+import _ha_stubs
+import _sample_feeds
+
+try:
+    from icalendar import Calendar
+except ImportError as err:
+    sys.exit(f"{err.name} is required, install the manifest requirements")
+
+coordinator = _ha_stubs.import_integration("coordinator")
+ics = _ha_stubs.import_integration("ics")
+
+START = date(2026, 1, 1)
+END = date(2028, 1, 1)
+
+
+def _calendar(*events: str) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Sample//DE", *events]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _event(*properties: str) -> str:
+    return "\r\n".join(
+        ["BEGIN:VEVENT", "DTSTAMP:20260105T061500Z", *properties, "END:VEVENT"]
+    )
+
+
+_PICKUP = _event(
+    "UID:plain@example.org",
+    "DTSTART;VALUE=DATE:20260302",
+    "DTEND;VALUE=DATE:20260303",
+    "SUMMARY:Restmüll",
+)
+
+FEEDS = {
+    "portal 2026": _sample_feeds.year_feed(2026),
+    "portal 2027, no. 12a": _sample_feeds.year_feed(2027, "12a"),
+    "byte order mark": "\ufeff" + _sample_feeds.year_feed(2026),
+    "LF line breaks": _calendar(_PICKUP).replace("\r\n", "\n"),
+    "escaped text": _calendar(
+        _event(
+            "UID:escaped@example.org",
+            "DTSTART;VALUE=DATE:20260304",
+            "SUMMARY:Papier\\, Pappe\\; Kartonagen",
+            "DESCRIPTION:Erste Zeile\\nZweite Zeile\\\\Ende",
+        )
+    ),
+    "folded with tab": _calendar(
+        _event(
+            "UID:folded@example.org",
+            "DTSTART;VALUE=DATE:20260305",
+            "SUMMARY:Grün",
+            "DESCRIPTION:Bitte bis 6:00 Uhr\r\n\tbereitstellen",
+        )
+    ),
+    "date-time values": _calendar(
+        _event(
+            "UID:utc@example.org",
+            "DTSTART:20260306T230000Z",
+            "DTEND:20260307T000000Z",
+            "SUMMARY:Gelber Sack",
+        ),
+        _event(
+            "UID:tzid@example.org",
+            "DTSTART;TZID=Europe/Berlin:20260307T060000",
+            "DTEND;TZID=Europe/Berlin:20260307T070000",
+            "SUMMARY:Bioabfall",
+        ),
+    ),
+    "no DTEND": _calendar(
+        _event("UID:open@example.org", "DTSTART;VALUE=DATE:20260308", "SUMMARY:Bio")
+    ),
+    "quoted parameter": _calendar(
+        _event(
+            "UID:quoted@example.org",
+            "DTSTART;VALUE=DATE:20260309",
+            'SUMMARY;ALTREP="http://example.org/a:b":Sperrmüll',
+        )
+    ),
+    "nested alarm": _calendar(
+        _event(
+            "UID:alarm@example.org",
+            "DTSTART;VALUE=DATE:20260310",
+            "SUMMARY:Altpapier",
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            "DESCRIPTION:Erinnerung",
+            "TRIGGER:-PT12H",
+            "END:VALARM",
+        )
+    ),
+}
+
+UNSUPPORTED = {
+    "RRULE": _sample_feeds.recurring_year_feed(2026),
+    "EXDATE": _calendar(
+        _event(
+            "UID:exdate@example.org",
+            "DTSTART;VALUE=DATE:20260302",
+            "EXDATE;VALUE=DATE:20260309",
+            "SUMMARY:Restmüll",
+        )
+    ),
+    "DURATION": _calendar(
+        _event(
+            "UID:duration@example.org",
+            "DTSTART;VALUE=DATE:20260302",
+            "DURATION:P2D",
+            "SUMMARY:Restmüll",
+        )
+    ),
+    "PERIOD value": _calendar(
+        _event(
+            "UID:period@example.org",
+            "DTSTART;VALUE=PERIOD:20260302T000000Z/P1D",
+            "SUMMARY:Restmüll",
+        )
+    ),
+}
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _icalendar_events(feed) -> list[tuple]:
+    """Return the fields of every VEVENT as icalendar reads them."""
+    events = []
+    for event in Calendar.from_ical(feed.to_ical()).walk("VEVENT"):
+        start = _as_date(event["DTSTART"].dt)
+        end = _as_date(event["DTEND"].dt) if "DTEND" in event else start
+        events.append(
+            (
+                str(event.get("UID", "")),
+                start,
+                end,
+                str(event.get("SUMMARY", "")),
+                str(event.get("DESCRIPTION", "")),
+            )
+        )
+    return events
+
+
+def _check(feed) -> str | None:
+    """Return what differs between tokenizer and icalendar, if anything."""
+    tokens = [tuple(event) for event in ics.tokenize_events(feed)]
+    reference = _icalendar_events(feed)
+    if len(tokens) != len(reference):
+        return f"{len(tokens)} events, icalendar found {len(reference)}"
+    for token, expected in zip(tokens, reference):
+        if token != expected:
+            return f"{token} != {expected}"
+    if sorted(coordinator._parse_tokens(feed, START, END)) != sorted(
+        coordinator._parse_with_icalendar(feed, START, END)
+    ):
+        return "pickups differ from the icalendar fallback"
+    return None
+
+
+def main() -> int:
+    """Check all sample feeds."""
+    failures = 0
+    for name, text in FEEDS.items():
+        feed = _sample_feeds.read_feed(ics, text, chunk_size=97)
+        try:
+            problem = _check(feed)
+        except ics.IcsUnsupported as err:
+            problem = f"unexpectedly unsupported: {err}"
+        print(f"{name:<24} {problem or f'ok, {len(feed.events)} events'}")
+        failures += problem is not None
+
+    for name, text in UNSUPPORTED.items():
+        feed = _sample_feeds.read_feed(ics, text)
+        try:
+            ics.tokenize_events(feed)
+        except ics.IcsUnsupported as err:
+            print(f"{name:<24} ok, falls back: {err}")
+        else:
+            print(f"{name:<24} accepted, but needs the icalendar fallback")
+            failures += 1
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Measure the import time of the integration modules.
+
+Imports each module in a fresh interpreter with python -X importtime,
+with Home Assistant replaced by stubs (see _ha_stubs.py), and reports the
+cumulative import time of the module including the integration package.
+Fails if a module pulls in a library that must only be imported lazily,
+or takes longer than --max-ms. The times include libraries Home Assistant
+has loaded anyway, like aiohttp, so compare runs rather than reading the
+absolute numbers.
+
+Requires aiohttp and voluptuous, which the integration imports directly.
+
+Usage: python scripts/import_time.py [--max-ms MS] [--repeat N]
+"""
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+COMPONENTS_DIR = SCRIPTS_DIR.parent / "custom_components"
+PACKAGE = "gfa_abfallkalender"
+
+MODULES = [
+    PACKAGE,
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.sensor",
+    f"{PACKAGE}.calendar",
+    f"{PACKAGE}.diagnostics",
+]
+
+# Only needed for feeds the lightweight tokenizer rejects
+LAZY_MODULES = {"icalendar", "recurring_ical_events"}
+
+_BOOTSTRAP = """
+import sys
+sys.path[:0] = [{scripts!r}, {components!r}]
+import _ha_stubs
+_ha_stubs.install()
+import {module}
+"""
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter.
+
+    Returns the cumulative import time of every module in microseconds.
+    """
+    code = _BOOTSTRAP.format(
+        scripts=str(SCRIPTS_DIR), components=str(COMPONENTS_DIR), module=module
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    """Measure all modules and check them against the limits."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = 0
+    for module in MODULES:
+        runs = [_import_times(module) for _ in range(args.repeat)]
+        # The cumulative time of a submodule includes its package
+        milliseconds = min(run[module] for run in runs) / 1000
+
+        lazy = LAZY_MODULES.intersection(
+            name.split(".")[0] for name in runs[0]
+        )
+        status = "ok"
+        if lazy:
+            status = f"imports {', '.join(sorted(lazy))}"
+            failures += 1
+        elif args.max_ms is not None and milliseconds > args.max_ms:
+            status = f"over {args.max_ms:.0f} ms"
+            failures += 1
+        print(f"{module:<32} {milliseconds:>8.1f} ms  {status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())